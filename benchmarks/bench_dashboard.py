@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark dashboard stats: legacy per-count queries vs materialized counters vs cached snapshot.
+
+Uses a throwaway SQLite database unless --database-url is given.
+
+Run:  python benchmarks/bench_dashboard.py [rows] [--database-url URL]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from throwaway_db import pop_database_url, use_database
+
+use_database(os.path.join(tempfile.mkdtemp(), 'bench_dashboard.db'), pop_database_url())
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (
+    app, db, CV, Job, _compute_dashboard_stats, _get_dashboard_stats, _invalidate_dashboard_stats,
+    reconcile_stat_counters
+)
+from synthetic_data import SyntheticDataset, chunked
+
+
+def legacy_stats():
+    """Dashboard stats as computed before aggregation (12 count queries)."""
+    cv_count = CV.query.count()
+    job_count = Job.query.count()
+    active_jobs = Job.query.filter_by(is_active=True).count()
+    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+    recent_cvs = CV.query.filter(CV.created_at >= week_ago).count()
+    next_week = datetime.now(timezone.utc) + timedelta(days=7)
+    expiring_jobs = Job.query.filter(Job.application_deadline <= next_week, Job.is_active == True).count()
+    cv_weekly_data = []
+    for i in range(7):
+        day_start = datetime.now(timezone.utc) - timedelta(days=6-i)
+        day_end = day_start + timedelta(days=1)
+        cv_weekly_data.append(CV.query.filter(CV.created_at >= day_start, CV.created_at < day_end).count())
+    return cv_count, job_count, active_jobs, recent_cvs, expiring_jobs, cv_weekly_data
+
+
+def populate(rows):
+    """Standard synthetic dataset (see seed_scale.py) dated relative to now."""
+    dataset = SyntheticDataset(seed=42, anchor=datetime.now(timezone.utc))
+    for table, source in ((CV.__table__, dataset.cvs(rows)), (Job.__table__, dataset.jobs(rows, active_ratio=0.7))):
+        for batch in chunked(source, 5000):
+            db.session.execute(table.insert(), batch)
+    db.session.commit()
+
+
+def timed(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with app.app_context():
+        db.create_all()
+        if CV.query.count() < rows:
+            print(f"Populating {rows} CVs and {rows} jobs...")
+            populate(rows - CV.query.count())
+            reconcile_stat_counters()
+
+        def counters():
+            _invalidate_dashboard_stats()
+            return _compute_dashboard_stats()
+
+        print(f"📊 Dashboard stats with {CV.query.count()} CVs / {Job.query.count()} jobs")
+        print(f"   Legacy (12 count queries):   {timed(legacy_stats, 5):8.2f} ms")
+        print(f"   Counters (3 small queries):  {timed(counters, 5):8.2f} ms")
+        _get_dashboard_stats()
+        print(f"   Cached snapshot:             {timed(_get_dashboard_stats, 1000):8.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
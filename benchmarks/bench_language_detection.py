@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-document language detection cost: fast path vs langdetect.
+
+Run:  python benchmarks/bench_language_detection.py [iterations]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from language_detection import detect_language, detect_language_fast, _get_langdetect
+
+SAMPLES = {
+    'vi': (
+        "Nguyễn Văn A - Kỹ sư phần mềm. Kinh nghiệm: 5 năm phát triển ứng dụng web với Python, "
+        "Django và React tại công ty công nghệ tài chính. Học vấn: Đại học Bách Khoa Hà Nội, "
+        "chuyên ngành Khoa học máy tính. Kỹ năng: làm việc nhóm, giao tiếp, quản lý dự án Agile. "
+    ) * 20,
+    'en': (
+        "John Doe - Senior Backend Engineer. Experience: 6 years building APIs with Python and Go "
+        "for e-commerce platforms. Education: Bachelor of Computer Science at the University of "
+        "Danang. Skills: Docker, Kubernetes, AWS, communication and leadership in agile teams. "
+    ) * 20,
+    'mixed': (
+        "Nguyen Van B. Software Engineer. Ky nang: Python, React, SQL. Du an: he thong quan ly "
+        "kho hang, toi uu hieu nang truy van. Chung chi: AWS SAA. "
+    ) * 20,
+}
+
+
+def bench(fn, text, iterations):
+    start = time.perf_counter()
+    result = None
+    for _ in range(iterations):
+        result = fn(text)
+    elapsed = (time.perf_counter() - start) / iterations
+    return result, elapsed * 1000
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    start = time.perf_counter()
+    langdetect = _get_langdetect()
+    langdetect.detect("warm up the language profiles")
+    print(f"langdetect import + profile load: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print()
+    print(f"{'sample':<8} {'fast path':>22} {'langdetect':>22} {'detect_language':>22}")
+
+    for name, text in SAMPLES.items():
+        fast, fast_ms = bench(detect_language_fast, text, iterations)
+        slow, slow_ms = bench(langdetect.detect, text, iterations)
+        full, full_ms = bench(detect_language, text, iterations)
+        print(f"{name:<8} {str(fast):>6} {fast_ms:>11.3f} ms/doc "
+              f"{str(slow):>6} {slow_ms:>11.3f} ms/doc "
+              f"{str(full):>6} {full_ms:>11.3f} ms/doc")
+
+
+if __name__ == "__main__":
+    main()
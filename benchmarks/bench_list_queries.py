@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark list-view queries: full ORM rows vs the column profiles (CV_LIST_OPTIONS, ...).
+
+Reports per view the statements executed, database time and the column bytes
+the result carried. Uses a throwaway SQLite database unless --database-url is given.
+
+Run:  python benchmarks/bench_list_queries.py [rows] [--database-url URL]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from throwaway_db import pop_database_url, use_database
+
+use_database(os.path.join(tempfile.mkdtemp(), 'bench_list_queries.db'), pop_database_url())
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (
+    app, db, CV, Job, CV_LIST_OPTIONS, CV_PICKER_OPTIONS, JOB_LIST_OPTIONS, JOB_PICKER_OPTIONS
+)
+from query_profile import QueryRecorder, payload_bytes
+from synthetic_data import SyntheticDataset, chunked
+
+def populate(rows):
+    """Standard synthetic dataset (see seed_scale.py), all jobs active."""
+    dataset = SyntheticDataset(seed=42, anchor=datetime.now(timezone.utc))
+    for table, source in ((CV.__table__, dataset.cvs(rows)), (Job.__table__, dataset.jobs(rows, active_ratio=1.0))):
+        for batch in chunked(source, 2000):
+            db.session.execute(table.insert(), batch)
+    db.session.commit()
+
+
+def measure(load):
+    db.session.expunge_all()
+    started = time.perf_counter()
+    with QueryRecorder(db.engine) as rec:
+        rows = load()
+    elapsed = time.perf_counter() - started
+    return rec.count, rec.seconds * 1000, elapsed * 1000, payload_bytes(rows) / 1024
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    with app.app_context():
+        db.create_all()
+        if CV.query.count() < rows:
+            print(f"Populating {rows} CVs and {rows} jobs...")
+            populate(rows - CV.query.count())
+
+        newest_cvs = lambda q: q.order_by(CV.created_at.desc(), CV.id.desc())
+        newest_jobs = lambda q: q.filter(Job.is_active == True).order_by(Job.created_at.desc(), Job.id.desc())
+        views = [
+            ('CV list page (100 rows)',
+             lambda: newest_cvs(CV.query).limit(100).all(),
+             lambda: newest_cvs(CV.query.options(*CV_LIST_OPTIONS)).limit(100).all()),
+            ('Job list page (100 rows)',
+             lambda: newest_jobs(Job.query).limit(100).all(),
+             lambda: newest_jobs(Job.query.options(*JOB_LIST_OPTIONS)).limit(100).all()),
+            ('Matching CV picker (all)',
+             lambda: newest_cvs(CV.query).all(),
+             lambda: newest_cvs(CV.query.options(*CV_PICKER_OPTIONS)).all()),
+            ('Matching job picker (all)',
+             lambda: newest_jobs(Job.query).all(),
+             lambda: newest_jobs(Job.query.options(*JOB_PICKER_OPTIONS)).all()),
+        ]
+
+        print(f"📊 List queries with {CV.query.count()} CVs / {Job.query.count()} jobs")
+        print(f"   {'view':28} {'mode':8} {'queries':>7} {'exec ms':>9} {'total ms':>9} {'payload KB':>11}")
+        for name, full, profiled in views:
+            for mode, load in (('full', full), ('profile', profiled)):
+                count, db_ms, total_ms, kb = measure(load)
+                print(f"   {name:28} {mode:8} {count:7d} {db_ms:9.1f} {total_ms:9.1f} {kb:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Report tokens per match prompt before and after compaction on the seeded data.
+
+Run:  python seed_all.py && python benchmarks/bench_prompt_tokens.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, CV, Job, DEFAULT_MATCHING_CRITERIA, match_prompts, _cv_match_text, _job_match_text
+from prompt_builder import MatchPromptBuilder, estimate_tokens
+
+LEGACY_SYSTEM = "Chỉ được trả về JSON hợp lệ, không thêm mô tả ngoài JSON."
+
+
+def legacy_prompt(cv, job):
+    """The match prompt as built before compaction (matching() / api_match_batch)."""
+    cv_text = f"""
+                    Name: {cv.name}
+                    Email: {cv.email}
+                    Phone: {cv.phone}
+                    Address: {cv.address}
+                    Education: {cv.education}
+                    Experience: {cv.experience}
+                    Skills: {cv.skills}
+                    """
+    job_text = f"""
+                    Title: {job.title}
+                    Company: {job.company}
+                    Description: {job.description}
+                    Requirements: {job.requirements}
+                    Location: {job.location}
+                    Employment Type: {job.employment_type}
+                    Salary Min: {job.salary_min}
+                    Salary Max: {job.salary_max}
+                    """
+    job_text += f"\nDefault Matching Rubric (strictly follow):\n{DEFAULT_MATCHING_CRITERIA}\n"
+    return f"""
+        Phân tích mức độ phù hợp giữa CV và JD. Trả về đúng JSON, nội dung TIẾNG VIỆT:
+
+        CV:
+        {cv_text}
+
+        JD:
+        {job_text}
+
+        Đầu ra JSON đúng cấu trúc (phải đủ các khóa dưới đây). KHÔNG được có dấu phẩy thừa, KHÔNG có comment, KHÔNG có text ngoài JSON:
+        {{
+            "match_score": 85,
+            "analysis": "tóm tắt tổng quan bằng tiếng Việt",
+            "strengths": ["điểm mạnh 1", "điểm mạnh 2"],
+            "weaknesses": ["khoảng trống 1", "khoảng trống 2"],
+            "recommendations": ["khuyến nghị 1", "khuyến nghị 2"],
+            "criteria_breakdown": [
+                {{
+                  "criterion": "Seniority / Level",
+                  "score": 100,
+                  "weight": 3,
+                  "weighted_score": 300,
+                  "explain": "giải thích ngắn gọn bằng tiếng Việt"
+                }},
+                {{
+                  "criterion": "Core Skills",
+                  "score": 90,
+                  "weight": 3,
+                  "weighted_score": 270,
+                  "explain": "..."
+                }}
+            ]
+        }}
+
+        match_score trong khoảng 0-100.
+        """
+
+
+def main():
+    with app.app_context():
+        cvs = CV.query.all()
+        jobs = Job.query.all()
+    if not cvs or not jobs:
+        print("❌ No CVs/jobs found. Seed the database first: python seed_all.py")
+        return
+
+    before = []
+    after = []
+    for job in jobs:
+        for cv in cvs:
+            before.append(estimate_tokens(LEGACY_SYSTEM) + estimate_tokens(legacy_prompt(cv, job)))
+            after.append(MatchPromptBuilder.count(
+                match_prompts.messages(_cv_match_text(cv), _job_match_text(job))))
+
+    static_prefix = estimate_tokens(match_prompts.system_with_rubric)
+    avg_before = sum(before) / len(before)
+    avg_after = sum(after) / len(after)
+    print(f"📊 Match prompt tokens over {len(before)} CV/job pairs")
+    print(f"   Before:  avg {avg_before:.0f}  max {max(before)}")
+    print(f"   After:   avg {avg_after:.0f}  max {max(after)}  ({(1 - avg_after / avg_before) * 100:.1f}% fewer)")
+    print(f"   Static system message: {static_prefix} tokens; "
+          f"per-pair user message: avg {avg_after - static_prefix:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Check that bulk import handles sparse rows, against a temporary SQLite file.
+
+Rows with blank cells must still be inserted by the one executemany INSERT
+per chunk, so every row needs the same columns. The check imports a CSV and
+an NDJSON file whose rows fill different columns and verifies that:
+  - every valid row is inserted and invalid ones are rejected,
+  - blank cells are stored as NULL and created_at gets its default.
+
+Run:  python benchmarks/check_bulk_import.py
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+workdir = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'import.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, CV, Job
+
+CVS_CSV = """name,email,phone,skills,experience_years
+Alice,alice@example.com,0901,Python,5
+Bob,,0902,,
+Carol,carol@example.com,,Go,2 years
+,nameless@example.com,0904,Java,1
+"""
+
+JOBS_NDJSON = [
+    {'title': 'Backend Developer', 'company': 'Acme', 'salary_min': 1000, 'seniority': 'senior'},
+    {'title': 'Data Engineer', 'description': 'Spark'},
+    {'title': 'QA', 'company': '', 'is_active': 'no'},
+]
+
+
+def main():
+    failures = 0
+
+    def check(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} {message}")
+
+    cvs_path = os.path.join(workdir, 'cvs.csv')
+    with open(cvs_path, 'w', encoding='utf-8') as handle:
+        handle.write(CVS_CSV)
+    jobs_path = os.path.join(workdir, 'jobs.ndjson')
+    with open(jobs_path, 'w', encoding='utf-8') as handle:
+        handle.write('\n'.join(json.dumps(record) for record in JOBS_NDJSON) + '\n')
+
+    with app.app_context():
+        db.create_all()
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=['import-data', 'cvs', cvs_path, '--chunk-size', '10'])
+    check(result.exit_code == 0, f"sparse CSV import finishes (exit {result.exit_code})")
+    if result.exception and not isinstance(result.exception, SystemExit):
+        print(f"   {result.exception!r}")
+    result = runner.invoke(args=['import-data', 'jobs', jobs_path, '--chunk-size', '10'])
+    check(result.exit_code == 0, f"sparse NDJSON import finishes (exit {result.exit_code})")
+
+    with app.app_context():
+        cvs = {cv.name: cv for cv in CV.query.all()}
+        jobs = {job.title: job for job in Job.query.all()}
+        check(sorted(cvs) == ['Alice', 'Bob', 'Carol'], f"3 CVs inserted, the nameless one rejected ({sorted(cvs)})")
+        bob = cvs.get('Bob')
+        check(bob is not None and bob.email is None and bob.skills is None and bob.cv_years_experience is None,
+              "blank CSV cells are stored as NULL")
+        check(all(cv.created_at is not None for cv in cvs.values()), "created_at gets its default")
+        check(len(jobs) == 3, f"3 jobs inserted ({len(jobs)})")
+        check(jobs.get('Data Engineer') is not None and jobs['Data Engineer'].company is None
+              and jobs['Data Engineer'].is_active, "missing NDJSON keys are NULL or the column default")
+        check(jobs.get('QA') is not None and jobs['QA'].is_active is False, "explicit values override defaults")
+
+    shutil.rmtree(workdir, ignore_errors=True)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Query-count regression check for a matching run.
+
+Scores a job against a small and a large CV selection through POST /matching
+(explicit selection and "all in scope"), with every result already stored,
+and fails if the number of statements grows with the number of CVs.
+The OpenAI call is replaced by a canned response to store the results.
+Uses a throwaway SQLite database unless --database-url is given.
+
+Run:  python benchmarks/check_matching_queries.py [--database-url URL]
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+from throwaway_db import pop_database_url, use_database
+
+use_database(os.path.join(tempfile.mkdtemp(), 'check_matching_queries.db'), pop_database_url())
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openai
+
+from app import app, db, CV, Job, matching_cache
+from query_profile import QueryRecorder
+
+SMALL, LARGE = 3, 30
+
+
+class _Obj(dict):
+    __getattr__ = dict.get
+
+
+def _fake_completion(**kwargs):
+    content = json.dumps({
+        "match_score": 70, "analysis": "ok", "strengths": [], "weaknesses": [], "recommendations": [],
+        "criteria_breakdown": [{"criterion": "Core Skills", "score": 70, "weight": 3, "weighted_score": 210, "explain": "ok"}]
+    })
+    if kwargs.get('stream'):
+        return iter([_Obj(choices=[_Obj(delta=_Obj(content=content))])])
+    return _Obj(choices=[_Obj(message=_Obj(content=content))], usage=_Obj(prompt_tokens=0, completion_tokens=0))
+
+
+def count_queries(client, form):
+    matching_cache.clear()  # exercise the stored-result path, not the in-memory cache
+    with QueryRecorder(db.engine) as rec:
+        response = client.post('/matching', data=form)
+    assert response.status_code == 200, response.status_code
+    return rec.count
+
+
+def main():
+    openai.ChatCompletion.create = _fake_completion
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        job = Job(title='Backend Developer', description='Python, Flask, MySQL', is_active=True)
+        db.session.add(job)
+        db.session.commit()
+        job_id = job.id
+
+        client = app.test_client()
+        client.post('/login', data={'username': 'admin'})
+
+        counts = {}
+        for size in (SMALL, LARGE):
+            db.session.add_all(CV(name=f'Candidate {i}', skills='Python, Flask') for i in range(CV.query.count(), size))
+            db.session.commit()
+            cv_ids = [cv.id for cv in CV.query.order_by(CV.id)]
+            client.post('/matching', data={'job_id': job_id})  # store a result for every pair
+            counts[size] = (
+                count_queries(client, {'job_id': job_id, 'cv_ids': cv_ids}),
+                count_queries(client, {'job_id': job_id}),
+            )
+
+    failures = 0
+    for index, label in enumerate(('selected CVs', 'all CVs in scope')):
+        small, large = counts[SMALL][index], counts[LARGE][index]
+        ok = small == large
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} {label}: {small} queries for {SMALL} CVs, {large} for {LARGE} CVs")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Check that the match prompt's system message is the same for every pair.
+
+Builds match prompts for CV/job pairs with different field values, with and
+without custom criteria, and fails if the system message changes between
+calls or differs from the prebuilt one: only the user message may carry
+per-pair text. Also prints the size of each system message.
+
+Run:  python benchmarks/check_prompt_prefix.py
+"""
+
+import os
+import sys
+import tempfile
+
+from throwaway_db import use_database
+
+use_database(os.path.join(tempfile.mkdtemp(), 'check_prompt_prefix.db'))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import CV, Job, match_prompts, _cv_match_text, _job_match_text
+from prompt_builder import estimate_tokens
+
+PAIRS = [
+    (CV(name='Alice', email='alice@example.com', skills='Python, SQL', experience='5 năm backend'),
+     Job(title='Backend Developer', company='Acme', description='APIs', requirements='Python')),
+    (CV(name='Bình', skills='Go', education='ĐH Bách Khoa'),
+     Job(title='Data Engineer', location='Hà Nội', salary_min=1000, salary_max=2000)),
+    (CV(name='Carol'), Job(title='QA')),
+]
+CRITERIA = ['', 'Ưu tiên kinh nghiệm fintech', 'Must know Kubernetes']
+
+
+def main():
+    failures = 0
+
+    def check(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} {message}")
+
+    systems = {'default rubric': set(), 'custom criteria': set()}
+    misplaced = []
+    for cv, job in PAIRS:
+        for criteria in CRITERIA:
+            for _ in range(2):
+                system, user = match_prompts.messages(_cv_match_text(cv), _job_match_text(job), criteria)
+                systems['custom criteria' if criteria else 'default rubric'].add(system['content'].encode('utf-8'))
+                if cv.name in system['content'] or cv.name not in user['content']:
+                    misplaced.append(cv.name)
+    check(not misplaced, f"CV text is only in the user message ({sorted(set(misplaced)) or 'all pairs'})")
+
+    expected = {
+        'default rubric': match_prompts.system_with_rubric.encode('utf-8'),
+        'custom criteria': match_prompts.system_without_rubric.encode('utf-8'),
+    }
+    for label, seen in systems.items():
+        check(seen == {expected[label]},
+              f"system message with {label} is byte-identical across calls ({len(seen)} variant(s))")
+        print(f"   {len(expected[label])} bytes, ~{estimate_tokens(expected[label].decode('utf-8'))} tokens")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+EXPLAIN check for the hot list, dashboard and matching queries.
+
+Requests the hot pages as an admin and as a regular user, records every
+SELECT they run against cv, job, match_result and stat_counter, and
+EXPLAINs each one. Exits non-zero if any of them reads a table without an
+index (a full table scan), e.g. because an index was dropped or a query
+changed shape. Works on SQLite (EXPLAIN QUERY PLAN) and MySQL (EXPLAIN).
+Uses a throwaway SQLite database unless --database-url is given.
+
+Run:  python benchmarks/check_query_plans.py [rows] [--database-url URL]
+"""
+
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+from throwaway_db import pop_database_url, use_database
+
+use_database(os.path.join(tempfile.mkdtemp(), 'check_query_plans.db'), pop_database_url())
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, text
+
+from app import app, db, CV, Job, MatchResult, User, reconcile_stat_counters
+
+HOT_TABLES = ('cv', 'job', 'match_result', 'stat_counter')
+PAGES = [
+    '/dashboard',
+    '/cvs',
+    '/cvs?page=2',
+    '/jobs',
+    '/matching',
+    '/api/cvs?limit=20',
+    '/api/jobs?active=1&limit=20',
+    '/api/jobs/1/top-candidates',
+]
+
+
+def populate(rows):
+    now = datetime.now(timezone.utc)
+    db.session.add(User(username='owner', email='owner@example.com', password_hash='-'))
+    db.session.flush()
+    owner_id = User.query.filter_by(username='owner').one().id
+    db.session.execute(CV.__table__.insert(), [{
+        'name': f"Candidate {i}",
+        'user_id': owner_id if i % 3 else None,
+        'created_at': now - timedelta(minutes=i),
+    } for i in range(rows)])
+    db.session.execute(Job.__table__.insert(), [{
+        'title': f"Job {i}",
+        'user_id': owner_id if i % 3 else None,
+        'is_active': i % 4 != 0,
+        'application_deadline': now + timedelta(days=i % 60 - 30),
+        'created_at': now - timedelta(minutes=i),
+    } for i in range(rows)])
+    db.session.execute(MatchResult.__table__.insert(), [{
+        'cv_id': i + 1, 'job_id': 1, 'criteria_hash': 'd41d8cd98f00b204e9800998ecf8427e',
+        'input_fingerprint': '-', 'match_score': i % 100,
+    } for i in range(rows)])
+    db.session.commit()
+    reconcile_stat_counters()
+
+
+def record_selects(client, url, label, captured):
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith('SELECT'):
+            tables = [t for t in HOT_TABLES if re.search(rf'\bFROM {t}\b|\bJOIN {t}\b', statement)]
+            if tables:
+                captured.append((label, statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        response = client.get(url)
+        assert response.status_code == 200, f"{url}: {response.status_code}"
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+
+
+def full_scans(conn, statement, parameters):
+    """Tables the plan reads without an index, plus the raw plan lines."""
+    if conn.dialect.name == 'sqlite':
+        plan = [row[-1] for row in conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)]
+        scans = [m.group(1) for line in plan for m in [re.match(r'SCAN (\w+)$', line)] if m]
+    else:
+        result = conn.exec_driver_sql('EXPLAIN ' + statement, parameters)
+        keys = list(result.keys())
+        rows = [dict(zip(keys, row)) for row in result]
+        plan = [f"{r.get('table')}: type={r.get('type')} key={r.get('key')} extra={r.get('Extra')}" for r in rows]
+        scans = [r['table'] for r in rows if r.get('type') == 'ALL']
+    return [t for t in scans if t in HOT_TABLES], plan
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app.config['WTF_CSRF_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        if CV.query.count() < rows:
+            populate(rows)
+        db.session.execute(text('ANALYZE' if db.engine.dialect.name == 'sqlite' else 'ANALYZE TABLE cv, job, match_result, stat_counter'))
+        db.session.commit()
+
+        captured = []
+        for username in ('admin', 'owner'):
+            client = app.test_client()
+            client.post('/login', data={'username': username})
+            for url in PAGES:
+                record_selects(client, url, f"{url} [{username}]", captured)
+
+        failures = 0
+        seen = set()
+        with db.engine.connect() as conn:
+            for label, statement, parameters in captured:
+                if statement in seen:
+                    continue
+                seen.add(statement)
+                scans, plan = full_scans(conn, statement, parameters)
+                if scans:
+                    failures += 1
+                    print(f"❌ {label}: full scan of {', '.join(scans)}")
+                    print(f"   {' '.join(statement.split())[:200]}")
+                    for line in plan:
+                        print(f"     {line}")
+        print(f"{'❌' if failures else '✅'} {len(seen)} hot queries checked, {failures} with full table scans")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Check read-replica routing locally with two SQLite files.
+
+The "replica" is a file copy of the primary taken before a job is created,
+so it lags behind. The check verifies that:
+  - list pages read from the replica,
+  - right after creating a job the same session reads from the primary and sees it,
+  - once the sticky window has passed reads go back to the replica,
+  - a query error on a reachable replica is not retried and does not take it out of rotation,
+  - an unreachable replica falls back to the primary.
+
+Run:  python benchmarks/check_replica_routing.py
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+workdir = tempfile.mkdtemp()
+PRIMARY = os.path.join(workdir, 'primary.db')
+REPLICA = os.path.join(workdir, 'replica.db')
+os.environ['DATABASE_URL'] = f"sqlite:///{PRIMARY}"
+os.environ['DATABASE_REPLICA_URLS'] = f"sqlite:///{REPLICA}"
+os.environ['REPLICA_STICKY_SECONDS'] = '1'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, Job, User, reconcile_stat_counters, replica_router
+from query_profile import QueryRecorder
+
+JOB_FORM = {
+    'title': 'Fresh Job', 'description': 'd', 'company': 'c', 'location': 'l', 'salary_min': '',
+    'salary_max': '', 'employment_type': 'Full-time', 'requirements': 'r',
+}
+
+
+def get(client, engines, url):
+    """GET url; return (status, body, statements on primary, statements on replica)."""
+    with QueryRecorder(engines[None]) as primary, QueryRecorder(engines['replica_0']) as replica:
+        response = client.get(url)
+    return response.status_code, response.get_data(as_text=True), primary.count, replica.count
+
+
+def main():
+    app.config['WTF_CSRF_ENABLED'] = False
+    failures = 0
+
+    def check(ok, message):
+        nonlocal failures
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} {message}")
+
+    with app.app_context():
+        db.create_all()
+        admin = User(username='admin', email='admin@example.com', is_admin=True)
+        admin.set_password('password123')
+        db.session.add_all([admin, Job(title='Old Job', is_active=True)])
+        db.session.commit()
+        reconcile_stat_counters()
+        engines = dict(db.engines)
+    engines[None].dispose()
+    shutil.copy(PRIMARY, REPLICA)  # "replication" up to here
+
+    # Requests run outside the setup app context so each gets its own session and g
+    client = app.test_client()
+    client.post('/login', data={'username': 'admin'})
+
+    status, body, on_primary, on_replica = get(client, engines, '/jobs')
+    check(status == 200 and on_replica > 0 and on_primary <= 1,
+          f"/jobs reads from the replica ({on_replica} replica / {on_primary} primary statements)")
+
+    client.post('/jobs/create', data=JOB_FORM)
+    status, body, on_primary, on_replica = get(client, engines, '/jobs')
+    check(status == 200 and on_replica == 0 and 'Fresh Job' in body,
+          "after a write the session reads its own job from the primary")
+
+    time.sleep(1.1)
+    status, body, on_primary, on_replica = get(client, engines, '/jobs')
+    check(status == 200 and on_replica > 0 and 'Fresh Job' not in body,
+          "after the sticky window reads return to the (lagging) replica")
+
+    with sqlite3.connect(REPLICA) as conn:
+        conn.execute('ALTER TABLE job RENAME TO job_moved')
+    status, body, on_primary, on_replica = get(client, engines, '/jobs')
+    check(status == 500 and replica_router.status()['replica_0'] == 'up',
+          "a failing query on a reachable replica is not retried on the primary and the replica stays up")
+
+    engines['replica_0'].dispose()
+    os.remove(REPLICA)
+    os.mkdir(REPLICA)  # a directory cannot be opened as a database
+    status, body, on_primary, on_replica = get(client, engines, '/jobs')
+    check(status == 200 and 'Fresh Job' in body, "an unreachable replica falls back to the primary")
+
+    shutil.rmtree(workdir, ignore_errors=True)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark suite: CV upload, batch matching, the matching page,
+dashboard and list pages, and their cache hit paths.
+
+Runs against a throwaway SQLite database (unless --database-url is given) filled
+with the standard synthetic dataset, and an in-process openai_stub server
+instead of the OpenAI API, so runs are reproducible offline. Results are
+written as JSON; with --baseline they are compared against a stored run and
+the script exits with status 1 when a metric regressed beyond --tolerance.
+
+Run:  python benchmarks/run_benchmarks.py --sizes 10000,100000 --save-baseline
+      python benchmarks/run_benchmarks.py --sizes 10000,100000 --baseline benchmarks/results/baseline.json
+"""
+
+import argparse
+import io
+import itertools
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+workdir = tempfile.mkdtemp(prefix='jobfit_bench_')
+sys.path.insert(0, ROOT)
+
+from sqlalchemy.engine import make_url
+
+from openai_stub import StubConfig, start_stub
+from throwaway_db import use_database
+from synthetic_data import SyntheticDataset, chunked, cv_document_lines, write_pdf
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='End-to-end benchmark suite.')
+    parser.add_argument('--sizes', default='10000,100000', help='CV counts to benchmark pages at (jobs = CVs / 10).')
+    parser.add_argument('--batch-sizes', default='10,50,200', help='CVs per /api/match-batch request.')
+    parser.add_argument('--uploads', type=int, default=10, help='PDF uploads to time.')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per page (after one warm-up).')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--database-url', help='Benchmark this database instead of a throwaway SQLite file. '
+                                               'Synthetic rows are inserted and CVs and match results deleted.')
+    parser.add_argument('--llm-latency', default='fixed:0', help='Stub latency distribution, e.g. lognormal:-1,0.3.')
+    parser.add_argument('--llm-token-ms', type=float, default=0.0, help='Stub milliseconds per output token.')
+    parser.add_argument('--output', default=os.path.join(RESULTS_DIR, 'latest.json'))
+    parser.add_argument('--baseline', help='Compare against this results file.')
+    parser.add_argument('--save-baseline', nargs='?', const=os.path.join(RESULTS_DIR, 'baseline.json'),
+                        help='Also store the results as the baseline (default benchmarks/results/baseline.json).')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative slowdown (default 0.25).')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0, help='Ignore latency changes smaller than this.')
+    return parser.parse_args(argv)
+
+
+def timings(samples):
+    samples = sorted(samples)
+    return {
+        'n': len(samples),
+        'mean_ms': round(statistics.fmean(samples) * 1000, 3),
+        'p50_ms': round(statistics.median(samples) * 1000, 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000, 3),
+        'min_ms': round(samples[0] * 1000, 3),
+        'max_ms': round(samples[-1] * 1000, 3),
+    }
+
+
+def measure(fn, repeat, warmup=1, before=None):
+    """Time fn() repeat times; before() runs untimed ahead of every call (e.g. to drop a cache)."""
+    samples = []
+    for run in range(warmup + repeat):
+        if before:
+            before()
+        started = time.perf_counter()
+        fn()
+        if run >= warmup:
+            samples.append(time.perf_counter() - started)
+    return timings(samples)
+
+
+def expect_ok(response, label):
+    if response.status_code >= 400:
+        raise RuntimeError(f"{label}: HTTP {response.status_code}")
+    return response
+
+
+def populate(A, dataset, cvs, jobs):
+    """Grow the database to cvs/jobs rows; generated rows are a stable prefix, so existing ones are skipped."""
+    with A.app.app_context():
+        if not A.User.query.filter_by(username='admin').first():
+            admin = A.User(username='admin', email='admin@example.com', is_admin=True)
+            admin.set_password('password123')
+            A.db.session.add(admin)
+            A.db.session.commit()
+        for model, rows, total in ((A.Job, dataset.jobs, jobs), (A.CV, dataset.cvs, cvs)):
+            existing = model.query.count()
+            for batch in chunked(itertools.islice(rows(total), existing, None), 5000):
+                A.db.session.execute(model.__table__.insert(), batch)
+            A.db.session.commit()
+        A.reconcile_stat_counters()
+    A._invalidate_dashboard_stats()
+
+
+def bench_pages(A, client, size, repeat, results):
+    def get(url):
+        return lambda: expect_ok(client.get(url), url)
+
+    drop_dashboard = A._invalidate_dashboard_stats
+    results[f"dashboard.cold@{size}"] = measure(get('/dashboard'), repeat, before=drop_dashboard)
+    results[f"dashboard.cached@{size}"] = measure(get('/dashboard'), repeat)
+    results[f"list.cvs@{size}"] = measure(get('/cvs'), repeat)
+    results[f"list.cvs_page50@{size}"] = measure(get('/cvs?page=50'), repeat)
+    results[f"list.jobs@{size}"] = measure(get('/jobs'), repeat)
+    results[f"api.cvs@{size}"] = measure(get('/api/cvs?limit=100'), repeat)
+    results[f"matching.render@{size}"] = measure(get('/matching'), max(1, repeat // 2))
+
+
+def reset_match_results(A, job_id):
+    with A.app.app_context():
+        A.MatchResult.query.filter_by(job_id=job_id).delete()
+        A.db.session.commit()
+    A.matching_cache.clear()
+
+
+def bench_matching(A, client, size, batch_sizes, repeat, results):
+    with A.app.app_context():
+        job_id = A.Job.query.filter_by(is_active=True).order_by(A.Job.id).first().id
+        cv_ids = [row.id for row in A.db.session.query(A.CV.id).order_by(A.CV.id).limit(max(batch_sizes))]
+
+    for n in batch_sizes:
+        payload = {'job_id': job_id, 'cv_ids': cv_ids[:n]}
+
+        def batch():
+            body = expect_ok(client.post('/api/match-batch', json=payload), 'match-batch').get_json()
+            if not body.get('success') or len(body['results']) != n:
+                raise RuntimeError(f"match-batch returned {len(body.get('results', []))} of {n} results")
+
+        # cold: every pair goes to the (stub) LLM and is stored; stored: MatchResult rows; memory: in-process cache
+        for mode, before in (('cold', lambda: reset_match_results(A, job_id)),
+                             ('stored', A.matching_cache.clear),
+                             ('memory', None)):
+            stats = measure(batch, repeat if mode != 'cold' else max(1, repeat // 2), before=before)
+            stats['cvs_per_s'] = round(n / (stats['p50_ms'] / 1000), 1) if stats['p50_ms'] else None
+            results[f"match_batch.{mode}.{n}cvs@{size}"] = stats
+
+        form = {'job_id': str(job_id), 'cv_ids': [str(i) for i in cv_ids[:n]]}
+        results[f"matching.results.{n}cvs@{size}"] = measure(
+            lambda: expect_ok(client.post('/matching', data=form), 'matching POST'), repeat)
+
+
+def bench_upload(A, client, size, count, seed, results):
+    pdf_dir = os.path.join(workdir, 'pdfs')
+    os.makedirs(pdf_dir, exist_ok=True)
+    paths = []
+    for index, row in enumerate(SyntheticDataset(seed=f"{seed}:uploads").cvs(count + 1)):
+        path = os.path.join(pdf_dir, f"cv_{index}.pdf")
+        write_pdf(path, cv_document_lines(row))
+        paths.append(path)
+
+    queue = iter(paths)
+
+    def upload():
+        path = next(queue)
+        with open(path, 'rb') as handle:
+            data = {'file': (io.BytesIO(handle.read()), os.path.basename(path))}
+        response = client.post('/cvs/create', data=data, content_type='multipart/form-data')
+        if response.status_code != 302:
+            raise RuntimeError(f"upload: HTTP {response.status_code}")
+
+    with A.app.app_context():
+        last_id = A.db.session.query(A.db.func.max(A.CV.id)).scalar()
+    results[f"upload.cv@{size}"] = measure(upload, count)
+
+    # Drop the uploaded CVs so the next size grows from the same synthetic rows
+    with A.app.app_context():
+        A.CV.query.filter(A.CV.id > last_id).delete()
+        A.db.session.commit()
+        A.reconcile_stat_counters()
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare(current, baseline, tolerance, min_delta_ms):
+    """Print current vs baseline per shared metric; returns the regressed keys.
+
+    Latency is compared on p50_ms (lower is better) and batch throughput on cvs_per_s (higher is better).
+    """
+    regressions = []
+    print(f"\n📊 Compared with baseline {baseline['meta'].get('revision') or '?'} "
+          f"({baseline['meta'].get('timestamp', '?')}), tolerance {tolerance:.0%}")
+    print(f"   {'benchmark':40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for key in sorted(current['results']):
+        base = baseline['results'].get(key)
+        if not base:
+            continue
+        now = current['results'][key]
+        if now.get('cvs_per_s') and base.get('cvs_per_s'):
+            old, new, unit = base['cvs_per_s'], now['cvs_per_s'], 'cv/s'
+            change = new / old - 1
+            regressed = change < -tolerance
+        else:
+            old, new, unit = base['p50_ms'], now['p50_ms'], 'ms'
+            change = new / old - 1 if old else 0.0
+            regressed = change > tolerance and new - old > min_delta_ms
+        if regressed:
+            regressions.append(key)
+        print(f"   {'❌' if regressed else '✅'} {key:38} {old:>9.2f} {unit:<4}{new:>9.2f} {unit:<4}{change:>+7.0%}")
+    missing = sorted(set(baseline['results']) - set(current['results']))
+    if missing:
+        print(f"   (not run this time: {', '.join(missing)})")
+    return regressions
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = sorted(int(s) for s in args.sizes.split(',') if s.strip())
+    batch_sizes = sorted(int(s) for s in args.batch_sizes.split(',') if s.strip())
+
+    stub_config = StubConfig(seed=args.seed, latency=args.llm_latency, token_ms=args.llm_token_ms)
+    stub = start_stub(stub_config)
+    os.environ['OPENAI_API_BASE'] = stub.base_url
+    os.environ.setdefault('OPENAI_API_KEY', 'stub')
+    use_database(os.path.join(workdir, 'bench.db'), args.database_url)
+
+    import app as A
+    A.app.config['WTF_CSRF_ENABLED'] = False
+    A.app.config['UPLOAD_FOLDER'] = os.path.join(workdir, 'uploads')
+    A.create_app()
+    for handler in A.log_listener.handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setLevel(logging.WARNING)  # keep the console readable; file logs still run
+    with A.app.app_context():
+        A.db.create_all()
+
+    dataset = SyntheticDataset(seed=args.seed, anchor=datetime.now(timezone.utc))
+    client = A.app.test_client()
+    results = {}
+    try:
+        for index, size in enumerate(sizes):
+            print(f"⏳ Populating {size:,} CVs / {size // 10:,} jobs...")
+            populate(A, dataset, size, size // 10)
+            expect_ok(client.post('/login', data={'username': 'admin'}), 'login')
+            print(f"⏱️  Pages @ {size:,}")
+            bench_pages(A, client, size, args.repeat, results)
+            if index == 0:
+                print(f"⏱️  Matching and uploads @ {size:,}")
+                bench_matching(A, client, size, batch_sizes, args.repeat, results)
+                if args.uploads:
+                    bench_upload(A, client, size, args.uploads, args.seed, results)
+    finally:
+        A.usage_ledger.flush()  # queued usage rows go to the temporary database removed below
+        stub.shutdown()
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'database': make_url(A.app.config['SQLALCHEMY_DATABASE_URI']).get_backend_name(),
+            'sizes': sizes,
+            'batch_sizes': batch_sizes,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'llm_stub': {'latency': args.llm_latency, 'token_ms': args.llm_token_ms},
+            'pdf_ocr': bool(shutil.which('pdftoppm')),  # without poppler uploads use the PyPDF2 fallback
+        },
+        'results': results,
+    }
+
+    print(f"\n📊 Results (p50 / p95 ms)")
+    for key, stats in results.items():
+        extra = f"  {stats['cvs_per_s']:,.1f} CVs/s" if stats.get('cvs_per_s') else ''
+        print(f"   {key:40} {stats['p50_ms']:10.2f} {stats['p95_ms']:10.2f}{extra}")
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2)
+        print(f"💾 Wrote {path}")
+
+    shutil.rmtree(workdir, ignore_errors=True)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        regressions = compare(report, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+        print("✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
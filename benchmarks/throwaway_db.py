@@ -0,0 +1,36 @@
+"""
+Database selection for the benchmark and check scripts.
+
+The scripts create tables, insert synthetic rows and delete rows, so they
+ignore DATABASE_URL (and DATABASE_REPLICA_URLS) from the environment and run
+against a throwaway SQLite file. Another database is used only when it is
+passed explicitly with --database-url.
+"""
+
+import os
+import sys
+
+
+def pop_database_url(argv=None):
+    """Remove --database-url URL (or --database-url=URL) from argv and return URL, or None."""
+    argv = sys.argv if argv is None else argv
+    for index, arg in enumerate(argv[1:], 1):
+        if arg.startswith('--database-url='):
+            del argv[index]
+            return arg.split('=', 1)[1]
+        if arg == '--database-url':
+            if index + 1 >= len(argv):
+                sys.exit("--database-url needs a URL")
+            url = argv[index + 1]
+            del argv[index:index + 2]
+            return url
+    return None
+
+
+def use_database(path, url=None):
+    """Point the app at url, or at a SQLite file at path; call before importing app."""
+    if url is None:
+        os.environ.pop('DATABASE_REPLICA_URLS', None)
+        url = f"sqlite:///{path}"
+    os.environ['DATABASE_URL'] = url
+    return url
@@ -0,0 +1,241 @@
+"""
+Bulk import of CVs and jobs from CSV or NDJSON.
+
+Records are normalized against the target table's column types (criteria
+fields included), validated, and inserted with one Core executemany INSERT
+per chunk, committed per chunk. A checkpoint file records how many source
+records are done after every commit, so a failed run resumes where it
+stopped instead of starting over.
+"""
+
+import csv
+import json
+import os
+import re
+import time
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+from sqlalchemy import Boolean, Date, DateTime, Integer, Numeric, String
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+_TRUE = {'1', 'true', 't', 'yes', 'y', 'on'}
+_FALSE = {'0', 'false', 'f', 'no', 'n', 'off'}
+_INT_RE = re.compile(r'-?\d+')
+
+
+def detect_format(path):
+    name = path[:-3] if path.endswith('.gz') else path
+    return 'ndjson' if name.endswith(('.ndjson', '.jsonl', '.json')) else 'csv'
+
+
+def _open_text(path):
+    if path.endswith('.gz'):
+        import gzip
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, 'r', encoding='utf-8-sig', newline='')
+
+
+def read_records(path, fmt):
+    """Yield source records as dicts, one per CSV row or NDJSON line (blank lines skipped)."""
+    with _open_text(path) as handle:
+        if fmt == 'csv':
+            yield from csv.DictReader(handle)
+            return
+        for number, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                record = {'__error__': f"line {number}: invalid JSON ({e})"}
+            yield record if isinstance(record, dict) else {'__error__': f"line {number}: not a JSON object"}
+
+
+class RowNormalizer:
+    """Map a source record onto table columns, coercing values to the column types.
+
+    Keys may be column names or, for prefixed criteria columns, the bare name
+    used by the CV extraction (e.g. 'seniority' for 'cv_seniority').
+    """
+
+    def __init__(self, table, prefix='', required=(), skip=('id',), defaults=None):
+        self.table = table
+        self.prefix = prefix
+        self.required = tuple(required)
+        self.defaults = defaults or {}
+        self.columns = {c.name: c for c in table.columns if c.name not in skip}
+        self.unknown_keys = set()
+
+    def _blank_row(self):
+        # Every row carries every column: one executemany INSERT needs the same keys in each row,
+        # so blank cells become None, or the column's Python-side default (e.g. created_at)
+        row = {}
+        for name, column in self.columns.items():
+            default = column.default
+            if default is not None and default.is_callable:
+                row[name] = default.arg(None)
+            elif default is not None and default.is_scalar:
+                row[name] = default.arg
+            else:
+                row[name] = None
+        row.update(self.defaults)
+        return row
+
+    def _column_for(self, key):
+        key = key.strip()
+        if key in self.columns:
+            return self.columns[key]
+        return self.columns.get(f"{self.prefix}{key}") if self.prefix else None
+
+    def _coerce(self, column, value):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = value.strip()
+            if value == '':
+                return None
+        kind = column.type
+        if isinstance(kind, Boolean):
+            text = str(value).lower()
+            if text in _TRUE:
+                return True
+            if text in _FALSE:
+                return False
+            raise ValueError(f"{column.name}: not a boolean ({value!r})")
+        if isinstance(kind, Integer):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return int(value)
+            match = _INT_RE.search(str(value))  # e.g. "5 years"
+            if not match:
+                raise ValueError(f"{column.name}: not an integer ({value!r})")
+            return int(match.group())
+        if isinstance(kind, Numeric):
+            try:
+                return Decimal(str(value).replace(',', ''))
+            except InvalidOperation:
+                raise ValueError(f"{column.name}: not a number ({value!r})") from None
+        if isinstance(kind, DateTime):
+            if isinstance(value, datetime):
+                return value
+            try:
+                return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+            except ValueError:
+                raise ValueError(f"{column.name}: not an ISO date/time ({value!r})") from None
+        if isinstance(kind, Date):
+            if isinstance(value, date):
+                return value
+            try:
+                return date.fromisoformat(str(value)[:10])
+            except ValueError:
+                raise ValueError(f"{column.name}: not an ISO date ({value!r})") from None
+        if isinstance(value, (list, dict)):
+            value = ', '.join(map(str, value)) if isinstance(value, list) else json.dumps(value, ensure_ascii=False)
+        value = str(value)
+        if isinstance(kind, String) and kind.length and len(value) > kind.length:
+            value = value[:kind.length]
+        return value
+
+    def normalize(self, record):
+        """Return (row, None) for a valid record or (None, error message)."""
+        if '__error__' in record:
+            return None, record['__error__']
+        row = self._blank_row()
+        try:
+            for key, value in record.items():
+                if key is None:
+                    continue  # extra CSV cells without a header
+                column = self._column_for(key)
+                if column is None:
+                    self.unknown_keys.add(key)
+                    continue
+                coerced = self._coerce(column, value)
+                if coerced is not None:
+                    row[column.name] = coerced
+        except ValueError as e:
+            return None, str(e)
+        missing = [name for name in self.required if row.get(name) in (None, '')]
+        if missing:
+            return None, f"missing required {', '.join(missing)}"
+        return row, None
+
+
+class Checkpoint:
+    """Progress of one import, saved as JSON after every committed chunk."""
+
+    def __init__(self, path, source):
+        self.path = path
+        stat = os.stat(source)
+        self.source = {'path': os.path.abspath(source), 'size': stat.st_size, 'mtime': int(stat.st_mtime)}
+        self.state = {'records_done': 0, 'inserted': 0, 'rejected': 0, 'completed': False}
+
+    def load(self):
+        """Resume state if the checkpoint belongs to the same source file; returns True if loaded."""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, encoding='utf-8') as handle:
+            saved = json.load(handle)
+        if saved.get('source') != self.source:
+            raise ValueError(f"Checkpoint {self.path} belongs to a different or modified source file")
+        self.state.update(saved.get('state', {}))
+        return True
+
+    def save(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as handle:
+            json.dump({'source': self.source, 'state': self.state}, handle)
+        os.replace(tmp, self.path)
+
+
+def import_records(session, table, records, normalizer, chunk_size, checkpoint, rejects=None, progress=None):
+    """Insert normalized records in chunks, committing and checkpointing after each chunk.
+
+    Records already counted in checkpoint.state['records_done'] are skipped.
+    rejects is an optional text file receiving one JSON line per invalid record;
+    progress(state, rows_per_second) is called after each chunk.
+    """
+    state = checkpoint.state
+    skip = state['records_done']
+    started = time.perf_counter()
+    inserted_this_run = 0
+    batch = []
+    pending_records = 0
+
+    def flush():
+        nonlocal batch, pending_records, inserted_this_run
+        if batch:
+            session.execute(table.insert(), batch)
+        session.commit()
+        state['records_done'] += pending_records
+        state['inserted'] += len(batch)
+        inserted_this_run += len(batch)
+        checkpoint.save()
+        if progress:
+            progress(state, inserted_this_run / max(time.perf_counter() - started, 1e-9))
+        batch = []
+        pending_records = 0
+
+    for index, record in enumerate(records):
+        if index < skip:
+            continue
+        pending_records += 1
+        row, error = normalizer.normalize(record)
+        if row is None:
+            state['rejected'] += 1
+            if rejects is not None:
+                rejects.write(json.dumps({'record': index + 1, 'error': error}, ensure_ascii=False) + '\n')
+        else:
+            batch.append(row)
+        if pending_records >= chunk_size:
+            flush()
+    flush()
+
+    state['completed'] = True
+    checkpoint.save()
+    elapsed = time.perf_counter() - started
+    return {
+        'inserted': inserted_this_run,
+        'seconds': elapsed,
+        'rows_per_second': inserted_this_run / elapsed if elapsed else 0.0,
+    }
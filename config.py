@@ -1,6 +1,9 @@
 import os
 from dotenv import load_dotenv
 
+from db_pool import MeteredQueuePool
+from db_routing import replica_bind_key
+
 # Load environment variables
 load_dotenv()
 
@@ -8,6 +11,45 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///jobfit_analytics.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Connection pool (MySQL): sized for concurrent matching requests
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '10'))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', '20'))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', '30'))  # seconds to wait for a free connection
+    # Recycle before the server (wait_timeout) or a proxy drops idle connections
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', '280'))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true'
+
+    # Read replicas: comma-separated URLs; read-only views query them, writes go to the primary
+    DATABASE_REPLICA_URLS = [url.strip() for url in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+    # Seconds a browser session keeps reading from the primary after it wrote (covers replication lag)
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', '10'))
+    # Seconds a failed replica is skipped before it is tried again
+    REPLICA_RETRY_SECONDS = int(os.environ.get('REPLICA_RETRY_SECONDS', '30'))
+
+    @classmethod
+    def replica_binds(cls):
+        """SQLALCHEMY_BINDS entries for the configured replicas"""
+        return {
+            replica_bind_key(index): {'url': url, **cls.engine_options(url)}
+            for index, url in enumerate(cls.DATABASE_REPLICA_URLS)
+        }
+
+    @classmethod
+    def engine_options(cls, database_uri):
+        """SQLALCHEMY_ENGINE_OPTIONS for database_uri; in-memory SQLite keeps its default pool"""
+        if database_uri in ('sqlite://', 'sqlite:///:memory:'):
+            return {'pool_pre_ping': cls.DB_POOL_PRE_PING}
+        return {
+            'poolclass': MeteredQueuePool,
+            'pool_size': cls.DB_POOL_SIZE,
+            'max_overflow': cls.DB_MAX_OVERFLOW,
+            'pool_timeout': cls.DB_POOL_TIMEOUT,
+            'pool_recycle': cls.DB_POOL_RECYCLE,
+            'pool_pre_ping': cls.DB_POOL_PRE_PING,
+        }
     UPLOAD_FOLDER = 'static/uploads'
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+    # OpenAI-compatible endpoint, e.g. http://127.0.0.1:8765/v1 for openai_stub.py
+    OPENAI_API_BASE = (os.environ.get('OPENAI_API_BASE') or 'https://api.openai.com/v1').rstrip('/')
@@ -0,0 +1,106 @@
+"""
+Connection pool instrumentation for the SQLAlchemy engine.
+
+MeteredQueuePool is a QueuePool that times every checkout, so pool
+exhaustion shows up as wait time and timeouts instead of only as slow
+requests. Each engine (the primary and every replica) has its own
+PoolMetrics, registered under a pool name by instrument_engine();
+pool_status() combines them with the pool's live gauges (size, checked out,
+overflow).
+"""
+
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """Thread-safe checkout counters and wait times."""
+
+    FIELDS = ('checkouts', 'timeouts', 'invalidated', 'connects', 'wait_seconds_total', 'wait_seconds_max')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(self.FIELDS, 0)
+
+    def record_wait(self, seconds, timed_out=False):
+        with self._lock:
+            if timed_out:
+                self._counters['timeouts'] += 1
+            else:
+                self._counters['checkouts'] += 1
+            self._counters['wait_seconds_total'] += seconds
+            self._counters['wait_seconds_max'] = max(self._counters['wait_seconds_max'], seconds)
+
+    def incr(self, field, amount=1):
+        with self._lock:
+            self._counters[field] += amount
+
+    def snapshot(self):
+        with self._lock:
+            data = dict(self._counters)
+        attempts = (data['checkouts'] + data['timeouts']) or 1
+        data['wait_ms_avg'] = round(data['wait_seconds_total'] / attempts * 1000, 3)
+        data['wait_ms_max'] = round(data.pop('wait_seconds_max') * 1000, 3)
+        data['wait_seconds_total'] = round(data['wait_seconds_total'], 3)
+        return data
+
+
+# Pool name ('primary', 'replica_0', ...) -> that engine's counters
+pool_metrics = {}
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool recording how long each checkout waited for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+def instrument_engine(engine, name):
+    """Register the engine's counters as name and count new DBAPI connections and
+    invalidations (e.g. stale ones dropped by pre-ping)."""
+    metrics = pool_metrics[name] = getattr(engine.pool, 'metrics', None) or PoolMetrics()
+    event.listen(engine, 'connect', lambda dbapi_conn, record: metrics.incr('connects'))
+    event.listen(engine, 'invalidate', lambda dbapi_conn, record, exc: metrics.incr('invalidated'))
+
+
+def pool_status(engine, name):
+    """Live pool gauges plus the checkout counters of the pool registered as name."""
+    pool = engine.pool
+    status = {'pool': name, 'pool_class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            'size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            # Negative while the pool has not opened pool_size connections yet
+            'overflow': pool.overflow(),
+            'max_overflow': pool._max_overflow,
+            'timeout_seconds': pool.timeout(),
+            'recycle_seconds': pool._recycle,
+            'pre_ping': pool._pre_ping,
+        })
+    metrics = pool_metrics.get(name)
+    status['metrics'] = metrics.snapshot() if metrics else None
+    return status
@@ -0,0 +1,138 @@
+"""
+Read-replica routing for the Flask-SQLAlchemy session.
+
+Views marked with read_replica() send their plain SELECTs to one of the
+replica engines (SQLALCHEMY_BINDS keys 'replica_0', 'replica_1', ...);
+flushes, INSERT/UPDATE/DELETE and SELECT ... FOR UPDATE always use the
+primary. After a request that wrote, the same browser session reads from
+the primary for a short window (read-your-writes), and a replica that fails
+is skipped for a while so reads fall back to the primary.
+"""
+
+import itertools
+import threading
+import time
+from functools import wraps
+
+from flask import g, has_request_context, request, session as http_session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.sql import CompoundSelect, Select
+
+REPLICA_BIND_PREFIX = 'replica_'
+STICKY_SESSION_KEY = 'db_primary_until'
+
+
+def replica_bind_key(index):
+    return f"{REPLICA_BIND_PREFIX}{index}"
+
+
+class ReplicaRouter:
+    """Round-robin choice among the replicas that have not failed recently."""
+
+    def __init__(self):
+        self.keys = []
+        self.sticky_seconds = 0
+        self.retry_seconds = 0
+        self._down_until = {}
+        self._lock = threading.Lock()
+        self._cycle = None
+
+    def configure(self, keys, sticky_seconds, retry_seconds):
+        self.keys = list(keys)
+        self.sticky_seconds = sticky_seconds
+        self.retry_seconds = retry_seconds
+        self._cycle = itertools.cycle(self.keys) if self.keys else None
+
+    def choose(self):
+        """A healthy replica bind key, or None to use the primary."""
+        if not self._cycle:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.keys)):
+                key = next(self._cycle)
+                if self._down_until.get(key, 0) <= now:
+                    return key
+        return None
+
+    def mark_down(self, key):
+        with self._lock:
+            self._down_until[key] = time.monotonic() + self.retry_seconds
+
+    def status(self):
+        now = time.monotonic()
+        with self._lock:
+            return {key: 'down' if self._down_until.get(key, 0) > now else 'up' for key in self.keys}
+
+    def watch(self, key, engine):
+        """Mark key down when its engine reports a connection-level error."""
+        def on_error(context):
+            if context.is_disconnect or context.connection is None:
+                self.mark_down(key)
+                if has_request_context():
+                    g.db_replica_failed = key
+        event.listen(engine, 'handle_error', on_error)
+
+
+replica_router = ReplicaRouter()
+
+
+def _reads_from_replica():
+    return has_request_context() and g.get('db_replica_key') is not None
+
+
+def _is_plain_select(clause):
+    return isinstance(clause, (Select, CompoundSelect)) and getattr(clause, '_for_update_arg', None) is None
+
+
+class RoutingSession(Session):
+    """Session sending read-only statements to the request's replica, everything else to the primary."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and _reads_from_replica() and _is_plain_select(clause):
+            return self._db.engines[g.db_replica_key]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def track_writes(db):
+    """Remember that the current request flushed changes, for read-your-writes stickiness."""
+    @event.listens_for(db.session, 'after_flush')
+    def _flushed(session, flush_context):
+        if has_request_context():
+            g.db_wrote = True
+
+
+def remember_writes(response):
+    """after_request hook: pin this browser session to the primary after it wrote."""
+    if g.get('db_wrote') and replica_router.keys:
+        http_session[STICKY_SESSION_KEY] = time.time() + replica_router.sticky_seconds
+    return response
+
+
+def read_replica(db):
+    """Decorator for read-only GET views whose queries may be served by a replica."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or http_session.get(STICKY_SESSION_KEY, 0) > time.time():
+                return view(*args, **kwargs)
+            key = replica_router.choose()
+            if key is None:
+                return view(*args, **kwargs)
+            g.db_replica_key = key
+            g.db_replica_failed = None
+            try:
+                return view(*args, **kwargs)
+            except (OperationalError, InterfaceError):
+                # Retry once on the primary only if the replica's connection failed (the watch()
+                # listener has marked it down); errors from the primary and lock or timeout
+                # errors on a working replica propagate as usual
+                if g.db_replica_failed != key:
+                    raise
+                db.session.rollback()
+                g.db_replica_key = None
+                return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,80 @@
+"""
+Incremental JSON / NDJSON export writers.
+
+Sections are consumed lazily (e.g. from yield_per queries) and written as
+they arrive, so memory stays flat whatever the number of rows. gzip_chunks
+compresses the text stream on the fly.
+"""
+
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+
+EXPORT_FORMATS = ('json', 'ndjson')
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value, indent=None):
+    return json.dumps(value, ensure_ascii=False, default=_default, indent=indent)
+
+
+def json_chunks(header, sections):
+    """One JSON object: header's keys, then each (name, rows) section as an array.
+
+    Arrays are written item by item; the result matches json.dumps(indent=2).
+    """
+    yield '{'
+    first = True
+    for key, value in header.items():
+        yield ('\n' if first else ',\n') + f'  {dumps(key)}: ' + dumps(value, indent=2).replace('\n', '\n  ')
+        first = False
+    for name, rows in sections:
+        yield ('\n' if first else ',\n') + f'  {dumps(name)}: ['
+        first = False
+        empty = True
+        for row in rows:
+            yield ('\n    ' if empty else ',\n    ') + dumps(row, indent=2).replace('\n', '\n    ')
+            empty = False
+        yield ']' if empty else '\n  ]'
+    yield '\n}'
+
+
+def ndjson_chunks(header, sections):
+    """One JSON document per line: {"type": "header", ...}, then {"type": <section>, ...} per row."""
+    yield dumps({'type': 'header', **header}) + '\n'
+    for name, rows in sections:
+        for row in rows:
+            yield dumps({'type': name, **row}) + '\n'
+
+
+def buffered(chunks, size=64 * 1024):
+    """Join small text chunks into ~size character writes."""
+    parts = []
+    length = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield ''.join(parts)
+            parts = []
+            length = 0
+    if parts:
+        yield ''.join(parts)
+
+
+def gzip_chunks(chunks, level=6):
+    """Gzip-compress a stream of text chunks (UTF-8) as it is produced."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,192 @@
+"""
+Incremental JSON parsing for streamed LLM responses.
+
+IncrementalJSONParser consumes response chunks as they arrive and reports
+top-level fields (e.g. match_score) and array items (e.g. each
+criteria_breakdown entry) as soon as they are complete. repair_truncated_json
+recovers the longest valid prefix of a truncated document; both track string
+and escape state so braces inside string values are never miscounted.
+"""
+
+import json
+
+
+def _closers(stack):
+    return ''.join('}' if c == '{' else ']' for c in reversed(stack))
+
+
+def repair_truncated_json(text: str):
+    """Close a truncated JSON object or array.
+
+    Returns a JSON string that parses, or None if nothing could be recovered.
+    Text after a complete top-level value is ignored.
+    """
+    if not text:
+        return None
+    starts = [i for i in (text.find('{'), text.find('[')) if i != -1]
+    if not starts:
+        return None
+    start = min(starts)
+
+    stack = []
+    in_string = False
+    escape = False
+    cuts = []  # (end index, open containers) where text[start:end] is a complete prefix
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in '{[':
+            stack.append(ch)
+            cuts.append((i + 1, tuple(stack)))
+        elif ch in '}]':
+            if not stack:
+                break
+            stack.pop()
+            if not stack:
+                return text[start:i + 1]
+            cuts.append((i + 1, tuple(stack)))
+        elif ch == ',':
+            cuts.append((i, tuple(stack)))
+
+    # Prefer keeping the partial tail (e.g. a cut-off string value), then walk back
+    tail = text[start:]
+    if in_string:
+        if escape:
+            tail = tail[:-1]
+        tail += '"'
+    candidates = [tail.rstrip() + _closers(stack)]
+    candidates.extend(text[start:end] + _closers(open_stack) for end, open_stack in reversed(cuts))
+
+    for candidate in candidates:
+        try:
+            json.loads(candidate)
+            return candidate
+        except ValueError:
+            continue
+    return None
+
+
+class IncrementalJSONParser:
+    """Scan a streamed JSON object and report completed parts as they arrive.
+
+    feed() returns a list of events:
+      ('field', key, value) - a top-level member is complete
+      ('item', key, value)  - an object inside one of item_keys' arrays is complete
+    Text before the first '{' (e.g. a markdown fence) is skipped.
+    """
+
+    def __init__(self, item_keys=('criteria_breakdown',)):
+        self.item_keys = set(item_keys)
+        self.buffer = ''
+        self.fields = {}
+        self.done = False
+        self._pos = 0
+        self._root = None
+        self._end = None
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = None
+        self._expect_key = False
+        self._key = None
+        self._member_start = None
+        self._item_start = None
+
+    def feed(self, chunk: str):
+        events = []
+        if not chunk or self.done:
+            return events
+        self.buffer += chunk
+        buf = self.buffer
+        i = self._pos
+        n = len(buf)
+        while i < n:
+            ch = buf[i]
+            if self._root is None:
+                if ch == '{':
+                    self._root = i
+                    self._stack.append('{')
+                    self._member_start = i + 1
+                    self._expect_key = True
+                i += 1
+                continue
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._expect_key and len(self._stack) == 1:
+                        self._key = json.loads(buf[self._string_start:i + 1])
+                        self._expect_key = False
+                i += 1
+                continue
+
+            depth = len(self._stack)
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch in '{[':
+                if ch == '{' and depth == 2 and self._stack[1] == '[' and self._key in self.item_keys:
+                    self._item_start = i
+                self._stack.append(ch)
+            elif ch in '}]':
+                self._stack.pop()
+                if len(self._stack) == 2 and self._item_start is not None:
+                    try:
+                        events.append(('item', self._key, json.loads(buf[self._item_start:i + 1])))
+                    except ValueError:
+                        pass
+                    self._item_start = None
+                elif not self._stack:
+                    self._complete_member(i, events)
+                    self._end = i + 1
+                    self.done = True
+                    i += 1
+                    break
+            elif ch == ',' and depth == 1:
+                self._complete_member(i, events)
+                self._member_start = i + 1
+                self._expect_key = True
+            i += 1
+        self._pos = i
+        return events
+
+    def _complete_member(self, end: int, events: list):
+        text = self.buffer[self._member_start:end].strip()
+        if not text:
+            return
+        try:
+            member = json.loads('{' + text + '}')
+        except ValueError:
+            return
+        for key, value in member.items():
+            self.fields[key] = value
+            events.append(('field', key, value))
+
+    def finish(self):
+        """Return the parsed object, repairing truncated output if the stream ended early."""
+        if self._root is None:
+            return None
+        if self.done:
+            try:
+                return json.loads(self.buffer[self._root:self._end])
+            except ValueError:
+                pass
+        repaired = repair_truncated_json(self.buffer[self._root:])
+        if repaired:
+            try:
+                return json.loads(repaired)
+            except ValueError:
+                pass
+        return dict(self.fields) or None
@@ -0,0 +1,89 @@
+"""
+Language detection for CV text.
+
+A cheap character-level fast path handles the common cases (Vietnamese text
+with diacritics, plain English text) and langdetect is only consulted for
+ambiguous input. langdetect is imported lazily so its profile loading is not
+paid at application startup.
+"""
+
+import re
+import unicodedata
+
+# Letters that only appear in Vietnamese among the Latin-script languages we see
+VI_SPECIFIC_CHARS = set("ăđơưĂĐƠƯ")
+# Latin Extended Additional block: precomposed Vietnamese tone marks (ạ, ế, ữ, ...)
+VI_EXTENDED_RANGE = (0x1EA0, 0x1EF9)
+
+EN_STOPWORDS = {
+    "the", "and", "of", "to", "in", "with", "for", "on", "at", "a", "an",
+    "is", "as", "by", "from", "my", "i", "experience", "skills", "education",
+}
+
+# Fast-path thresholds
+MIN_LETTERS = 20
+VI_RATIO_THRESHOLD = 0.02
+ASCII_RATIO_THRESHOLD = 0.995
+EN_STOPWORD_RATIO = 0.08
+# Amount of text inspected; enough to classify a CV, cheap even for huge OCR dumps
+SAMPLE_CHARS = 5000
+
+_WORD_RE = re.compile(r"[a-z]+")
+_langdetect = None
+
+
+def _get_langdetect():
+    """Import langdetect on first use and make it deterministic."""
+    global _langdetect
+    if _langdetect is None:
+        import langdetect
+        langdetect.DetectorFactory.seed = 0
+        _langdetect = langdetect
+    return _langdetect
+
+
+def detect_language_fast(text: str):
+    """Classify text as 'vi' or 'en' from character statistics.
+
+    Returns None when the text is too short or ambiguous to decide.
+    """
+    if not text:
+        return None
+    sample = unicodedata.normalize('NFC', text[:SAMPLE_CHARS])
+
+    letters = 0
+    ascii_letters = 0
+    vi_chars = 0
+    for ch in sample:
+        if not ch.isalpha():
+            continue
+        letters += 1
+        if ch.isascii():
+            ascii_letters += 1
+        elif ch in VI_SPECIFIC_CHARS or VI_EXTENDED_RANGE[0] <= ord(ch) <= VI_EXTENDED_RANGE[1]:
+            vi_chars += 1
+
+    if letters < MIN_LETTERS:
+        return None
+    if vi_chars / letters >= VI_RATIO_THRESHOLD:
+        return 'vi'
+    if ascii_letters / letters >= ASCII_RATIO_THRESHOLD:
+        words = _WORD_RE.findall(sample.lower())
+        if words:
+            hits = sum(1 for w in words if w in EN_STOPWORDS)
+            if hits / len(words) >= EN_STOPWORD_RATIO:
+                return 'en'
+    return None
+
+
+def detect_language(text: str):
+    """Detect the language code of text, or None if it cannot be determined."""
+    if not text or not text.strip():
+        return None
+    lang = detect_language_fast(text)
+    if lang:
+        return lang
+    try:
+        return _get_langdetect().detect(text[:SAMPLE_CHARS])
+    except Exception:
+        return None
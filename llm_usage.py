@@ -0,0 +1,240 @@
+"""
+Per-call LLM usage ledger: tokens, estimated cost, latency, retries and cache status.
+
+UsageLedger.record() only builds a row and puts it on a bounded queue; a
+daemon thread writes queued rows in batches through the write callback
+given by the app (one executemany INSERT per batch), so ledger writes never
+block a request. Rows are dropped (and counted) when the queue is full or a
+write fails; the ledger is accounting data, not something to fail a match
+over. usage_scope() attributes the calls made inside it to a user, job
+and CV.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+# Estimated USD per 1M (prompt, completion) tokens; longest matching model prefix wins
+DEFAULT_PRICES = {
+    'gpt-3.5-turbo': (0.50, 1.50),
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4-turbo': (10.00, 30.00),
+    'gpt-4': (30.00, 60.00),
+}
+
+# Rough chars-per-token ratio for calls that report no usage (streamed completions)
+CHARS_PER_TOKEN = 4
+
+_scope = contextvars.ContextVar('llm_usage_scope', default={})
+
+
+def parse_prices(spec):
+    """Parse "model=prompt:completion,..." (USD per 1M tokens) into a price table."""
+    prices = {}
+    for item in filter(None, (part.strip() for part in (spec or '').split(','))):
+        model, _, rates = item.partition('=')
+        prompt_rate, _, completion_rate = rates.partition(':')
+        try:
+            prices[model.strip()] = (float(prompt_rate), float(completion_rate or prompt_rate))
+        except ValueError:
+            raise ValueError(f"Invalid LLM price {item!r}; expected model=prompt:completion") from None
+    return prices
+
+
+def estimate_tokens(text):
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN if text else 0
+
+
+@contextlib.contextmanager
+def usage_scope(**ids):
+    """Attribute LLM calls made inside the block to user_id / job_id / cv_id."""
+    token = _scope.set({**_scope.get(), **{key: value for key, value in ids.items() if value is not None}})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def current_scope():
+    return _scope.get()
+
+
+def scoped_iter(iterable, **ids):
+    """Iterate with usage_scope(**ids) active only while producing each item.
+
+    For generators consumed by a streamed response: a scope held open across
+    a yield would leak into whatever runs next in the thread if the response
+    is never closed.
+    """
+    iterator = iter(iterable)
+    try:
+        while True:
+            with usage_scope(**ids):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close:
+            close()
+
+
+class LLMCall:
+    """Records one ledger row for the LLM call made inside the with block.
+
+    Set .response to the OpenAI response (or Responses API dict) for its model
+    and usage, or .usage directly. An exception in the block records status
+    'error', and closing a generator mid-stream records 'cancelled'.
+    """
+
+    def __init__(self, ledger, kind, model, **fields):
+        self.ledger = ledger
+        self.kind = kind
+        self.model = model
+        self.fields = fields
+        self.response = None
+        self.usage = None
+        self.status = 'ok'
+        self.estimated = False
+
+    def estimate(self, prompt, completion):
+        """Token counts from text length, for streamed completions that report no usage."""
+        self.usage = {'prompt_tokens': estimate_tokens(prompt), 'completion_tokens': estimate_tokens(completion)}
+        self.estimated = True
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        response = self.response or {}
+        if exc_type is GeneratorExit:
+            self.status = 'cancelled'
+        elif exc_type is not None:
+            self.status = 'error'
+        self.ledger.record(
+            self.kind, response.get('model') or self.model, time.perf_counter() - self.started,
+            self.usage or response.get('usage'), status=self.status, estimated=self.estimated, **self.fields)
+        return False
+
+
+class UsageLedger:
+    """Bounded queue of usage rows drained by a background writer thread."""
+
+    def __init__(self, write, prices=None, batch_size=200, flush_seconds=2.0, max_queue=10000, enabled=True):
+        self.write = write
+        self.prices = dict(DEFAULT_PRICES, **(prices or {}))
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.enabled = enabled
+        self._queue = queue.Queue(max_queue)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self.stats = {'recorded': 0, 'written': 0, 'dropped': 0, 'write_errors': 0}
+
+    def price(self, model):
+        matches = [name for name in self.prices if (model or '').startswith(name)]
+        return self.prices[max(matches, key=len)] if matches else None
+
+    def cost(self, model, prompt_tokens, completion_tokens):
+        rates = self.price(model)
+        if rates is None:
+            return None
+        return round((prompt_tokens * rates[0] + completion_tokens * rates[1]) / 1_000_000, 8)
+
+    def record(self, kind, model, latency=None, usage=None, attempt=0, cache='miss', status='ok',
+               estimated=False, **ids):
+        """Queue one ledger row; usage is an OpenAI usage dict (chat or Responses API keys)."""
+        if not self.enabled:
+            return
+        usage = usage or {}
+        prompt_tokens = int(usage.get('prompt_tokens', usage.get('input_tokens')) or 0)
+        completion_tokens = int(usage.get('completion_tokens', usage.get('output_tokens')) or 0)
+        scope = {**_scope.get(), **{key: value for key, value in ids.items() if value is not None}}
+        row = {
+            'created_at': datetime.now(timezone.utc),
+            'kind': kind,
+            'model': model,
+            'cache': cache,
+            'status': status,
+            'attempt': attempt,
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'cost_usd': self.cost(model, prompt_tokens, completion_tokens) if cache == 'miss' else 0.0,
+            'tokens_estimated': estimated,
+            'latency_ms': round(latency * 1000, 1) if latency is not None else None,
+            'user_id': scope.get('user_id'),
+            'job_id': scope.get('job_id'),
+            'cv_id': scope.get('cv_id'),
+        }
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                self.stats['dropped'] += 1
+            return
+        with self._lock:
+            self.stats['recorded'] += 1
+
+    def call(self, kind, model, **fields):
+        return LLMCall(self, kind, model, **fields)
+
+    def flush(self, timeout=10.0):
+        """Wait until every queued row has been written (or timeout seconds pass)."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return not self._queue.unfinished_tasks
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.stats, queued=self._queue.qsize())
+
+    def _ensure_writer(self):
+        # Started on first use and again in a forked worker, where the parent's thread does not exist
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name='llm-usage-writer', daemon=True)
+                self._thread.start()
+                atexit.register(self.flush, 2.0)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_seconds
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self.write(batch)
+                with self._lock:
+                    self.stats['written'] += len(batch)
+            except Exception as e:
+                with self._lock:
+                    self.stats['write_errors'] += 1
+                    self.stats['dropped'] += len(batch)
+                logger.warning("Could not write %d LLM usage rows: %s", len(batch), e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
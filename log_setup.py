@@ -0,0 +1,131 @@
+"""
+Queue-based logging for the app log and the matching trace log.
+
+Loggers only put records on an in-memory queue (QueueHandler); one
+QueueListener thread formats them and writes to the size-rotated files
+and the console, so file and terminal I/O stay out of the request. Payload
+dumps (raw LLM responses, parsed dicts) are logged at DEBUG with lazy
+%-style arguments: at the default INFO level they are dropped before any
+formatting, and with DEBUG enabled PayloadSampler keeps only a fraction
+of them.
+
+matching_debug.log is JSON lines: ts, level, run (one id per request that
+logs matching lines), any structured fields passed as
+extra={'trace': {...}} (event, cv_id, job_id, cache, score, timings) and
+msg. view_matching_log.py filters it without loading it into memory.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import uuid
+from datetime import datetime, timezone
+
+from flask import g, has_app_context
+
+MATCHING_LOGGER = 'matching_debug'
+
+
+class RunContext(logging.Filter):
+    """Tag records with the current request's match run id (runs in the logging thread, before queueing)."""
+
+    def filter(self, record):
+        if has_app_context():
+            record.run_id = g.setdefault('match_run_id', uuid.uuid4().hex[:12])
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line; trace fields come from extra={'trace': {...}}."""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'run': getattr(record, 'run_id', None),
+        }
+        entry.update(getattr(record, 'trace', None) or {})
+        entry['msg'] = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class PayloadSampler(logging.Filter):
+    """Pass every INFO+ record and a random fraction of DEBUG records."""
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return record.levelno > logging.DEBUG or self.rate >= 1 or random.random() < self.rate
+
+
+class _MatchingRoute(logging.Filter):
+    """Accept only matching_debug records (matching=True) or only the others."""
+
+    def __init__(self, matching):
+        super().__init__()
+        self.matching = matching
+
+    def filter(self, record):
+        return (record.name == MATCHING_LOGGER) == self.matching
+
+
+def _rotating(path, max_bytes, backup_count, formatter):
+    handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                                   encoding='utf-8', delay=True)
+    handler.setFormatter(formatter)
+    return handler
+
+
+def configure_logging(log_dir='logs', level=logging.INFO, matching_path='matching_debug.log',
+                      matching_level=logging.INFO, payload_sample=1.0, max_bytes=50 * 1024 * 1024,
+                      backup_count=5, console=True):
+    """Route the root and matching_debug loggers through one background listener; returns the listener."""
+    os.makedirs(log_dir, exist_ok=True)
+    records = queue.SimpleQueue()
+
+    app_handlers = [_rotating(os.path.join(log_dir, 'app.log'), max_bytes, backup_count,
+                              logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))]
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+        app_handlers.append(console_handler)
+    matching_handler = _rotating(matching_path, max_bytes, backup_count, JsonLinesFormatter())
+
+    # One queue and thread for both destinations; records are routed by logger name
+    for handler in app_handlers:
+        handler.addFilter(_MatchingRoute(False))
+    matching_handler.addFilter(_MatchingRoute(True))
+    listener = logging.handlers.QueueListener(records, *app_handlers, matching_handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers[:] = [logging.handlers.QueueHandler(records)]
+
+    matching = logging.getLogger(MATCHING_LOGGER)
+    matching.setLevel(matching_level)
+    # Kept out of app.log and the console, which used to repeat every matching line
+    matching.propagate = False
+    matching_queue_handler = logging.handlers.QueueHandler(records)
+    matching_queue_handler.addFilter(PayloadSampler(payload_sample))
+    matching_queue_handler.addFilter(RunContext())
+    matching.handlers[:] = [matching_queue_handler]
+
+    listener.start()
+    atexit.register(stop_listener, listener)
+    return listener
+
+
+def stop_listener(listener):
+    """Flush queued records and stop the listener thread; safe to call more than once."""
+    if listener._thread is not None:
+        listener.stop()
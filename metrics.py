@@ -0,0 +1,247 @@
+"""
+Lightweight in-process timing spans and Prometheus text exposition.
+
+span('llm.match') times a block into the jobfit_stage_seconds histogram and,
+inside a request, into that request's per-stage totals (sent as a
+Server-Timing header when enabled). instrument_app() adds the request
+histogram and times every SQL statement as the 'db.query' stage. When
+metrics are disabled span() returns a shared no-op context manager, so
+instrumented code pays one global lookup and a function call.
+"""
+
+import bisect
+import contextlib
+import threading
+import time
+from functools import wraps
+
+from flask import before_render_template, g, has_request_context, request, template_rendered
+from sqlalchemy import event
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+ENABLED = True
+_NOOP = contextlib.nullcontext()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(names, values, extra=''):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label combination."""
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+        for labels, (counts, total, count) in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                bucket_labels = _labels(self.labelnames, labels, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        lines.extend(f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}" for labels, value in values)
+        return lines
+
+
+class Registry:
+    """Metrics plus collector callbacks returning extra exposition lines (e.g. pool gauges)."""
+
+    def __init__(self):
+        self.metrics = []
+        self.collectors = []
+
+    def histogram(self, *args, **kwargs):
+        metric = Histogram(*args, **kwargs)
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, *args, **kwargs):
+        metric = Counter(*args, **kwargs)
+        self.metrics.append(metric)
+        return metric
+
+    def collector(self, fn):
+        self.collectors.append(fn)
+        return fn
+
+    def expose(self):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.expose())
+        for collect in self.collectors:
+            lines.extend(collect())
+        return '\n'.join(lines) + '\n'
+
+
+def gauge_lines(name, documentation, samples, labelnames=(), metric_type='gauge'):
+    """Exposition lines for a gauge (or a counter kept elsewhere) from [(label values, value), ...]."""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {metric_type}"]
+    lines.extend(f"{name}{_labels(labelnames, labels)} {_number(value)}" for labels, value in samples)
+    return lines
+
+
+registry = Registry()
+stage_seconds = registry.histogram(
+    'jobfit_stage_seconds', 'Time spent per pipeline stage (DB, prompt, LLM, parsing, cache, rendering).', ('stage',))
+request_seconds = registry.histogram(
+    'jobfit_request_seconds', 'HTTP request handling time until the response is returned.', ('endpoint', 'method', 'status'))
+cache_lookups = registry.counter(
+    'jobfit_cache_lookups_total', 'Match result lookups by cache layer and outcome.', ('cache', 'result'))
+
+
+def record(name, seconds):
+    stage_seconds.observe((name,), seconds)
+    if has_request_context():
+        stages = g.setdefault('metric_stages', {})
+        stages[name] = stages.get(name, 0.0) + seconds
+
+
+class _Span:
+    __slots__ = ('name', 'started')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+def span(name):
+    """Context manager timing a stage; a shared no-op when metrics are disabled."""
+    if not ENABLED:
+        return _NOOP
+    return _Span(name)
+
+
+def timed(name):
+    """Decorator form of span() for functions with many return paths."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            with _Span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def cache_lookup(cache, hit):
+    if ENABLED:
+        cache_lookups.inc((cache, 'hit' if hit else 'miss'))
+
+
+def configure(enabled):
+    global ENABLED
+    ENABLED = enabled
+
+
+def _server_timing(stages):
+    return ', '.join(f"{name.replace('.', '-')};dur={seconds * 1000:.1f}" for name, seconds in stages.items())
+
+
+def instrument_app(app, engines, server_timing=False):
+    """Request histogram, per-statement DB and template render timing, and an optional Server-Timing header."""
+    if not ENABLED:
+        return
+
+    @app.before_request
+    def _start_request_timer():
+        g.metric_started = time.perf_counter()
+
+    @app.after_request
+    def _observe_request(response):
+        started = g.get('metric_started')
+        if started is not None:
+            request_seconds.observe(
+                (request.endpoint or 'unmatched', request.method, str(response.status_code)),
+                time.perf_counter() - started)
+            if server_timing and g.get('metric_stages'):
+                response.headers['Server-Timing'] = _server_timing(g.metric_stages)
+        return response
+
+    def _before_cursor(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('metric_query_started', []).append(time.perf_counter())
+
+    def _after_cursor(conn, cursor, statement, parameters, context, executemany):
+        record('db.query', time.perf_counter() - conn.info['metric_query_started'].pop())
+
+    def _query_failed(context):
+        started = context.connection.info.get('metric_query_started') if context.connection is not None else None
+        if started:
+            started.pop()
+
+    def _before_render(sender, template, context, **extra):
+        if has_request_context():
+            g.setdefault('metric_render_started', []).append(time.perf_counter())
+
+    def _rendered(sender, template, context, **extra):
+        if has_request_context() and g.get('metric_render_started'):
+            record('template.render', time.perf_counter() - g.metric_render_started.pop())
+
+    before_render_template.connect(_before_render, app, weak=False)
+    template_rendered.connect(_rendered, app, weak=False)
+
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', _before_cursor)
+        event.listen(engine, 'after_cursor_execute', _after_cursor)
+        event.listen(engine, 'handle_error', _query_failed)
@@ -0,0 +1,58 @@
+"""Composite indexes for list, dashboard and matching queries
+
+Replaces the single-column user_id indexes on cv and job with composites
+matched to the query shapes (scope filter, is_active, newest-first keyset
+order, deadline). Databases created from schema_full.sql or db.create_all()
+may already have some of them, so each index is created only if missing.
+
+Revision ID: 3c1f2a9d7b10
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1f2a9d7b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('cv', 'idx_cv_created', ['created_at', 'id']),
+    ('cv', 'idx_cv_user_created', ['user_id', 'created_at', 'id']),
+    ('job', 'idx_job_active_created', ['is_active', 'created_at', 'id']),
+    ('job', 'idx_job_user_active_created', ['user_id', 'is_active', 'created_at', 'id']),
+    ('job', 'idx_job_created', ['created_at', 'id']),
+    ('job', 'idx_job_active_deadline', ['is_active', 'application_deadline']),
+]
+
+# Superseded by the (user_id, ...) composites, which also back the foreign keys
+LEGACY_INDEXES = [
+    ('cv', 'idx_cv_user_id', ['user_id']),
+    ('job', 'idx_job_user_id', ['user_id']),
+]
+
+
+def _existing(table):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade():
+    for table, name, columns in INDEXES:
+        if name not in _existing(table):
+            op.create_index(name, table, columns)
+    for table, name, _ in LEGACY_INDEXES:
+        if name in _existing(table):
+            op.drop_index(name, table_name=table)
+
+
+def downgrade():
+    for table, name, columns in LEGACY_INDEXES:
+        if name not in _existing(table):
+            op.create_index(name, table, columns)
+    for table, name, _ in reversed(INDEXES):
+        if name in _existing(table):
+            op.drop_index(name, table_name=table)
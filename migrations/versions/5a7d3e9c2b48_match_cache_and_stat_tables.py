@@ -0,0 +1,79 @@
+"""Detected CV language, stored match results and statistics counters
+
+Adds cv.detected_language and the match_result and stat_counter tables to
+databases created before them. Databases created from schema_full.sql or
+db.create_all() already have some or all of them, so each is added only if
+missing. Run `flask --app app reconcile-stats` afterwards to fill
+stat_counter.
+
+Revision ID: 5a7d3e9c2b48
+Revises: 8e4b6c2d1f35
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a7d3e9c2b48'
+down_revision = '8e4b6c2d1f35'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def _has_table(table):
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade():
+    if 'detected_language' not in _columns('cv'):
+        with op.batch_alter_table('cv') as batch_op:
+            batch_op.add_column(sa.Column('detected_language', sa.String(length=10), nullable=True))
+
+    if not _has_table('match_result'):
+        op.create_table(
+            'match_result',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('cv_id', sa.Integer(), nullable=False),
+            sa.Column('job_id', sa.Integer(), nullable=False),
+            sa.Column('criteria_hash', sa.String(length=32), nullable=False),
+            sa.Column('input_fingerprint', sa.String(length=64), nullable=False),
+            sa.Column('model', sa.String(length=50), nullable=True),
+            sa.Column('match_score', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('result', sa.JSON(), nullable=True),
+            sa.Column('llm_seconds', sa.Float(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.ForeignKeyConstraint(['cv_id'], ['cv.id'], name='fk_match_result_cv', ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['job_id'], ['job.id'], name='fk_match_result_job', ondelete='CASCADE'),
+            sa.UniqueConstraint('cv_id', 'job_id', 'criteria_hash', name='uq_match_result_pair'),
+        )
+        op.create_index('idx_match_result_job_score', 'match_result', ['job_id', 'match_score'])
+
+    if not _has_table('stat_counter'):
+        op.create_table(
+            'stat_counter',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('entity', sa.String(length=20), nullable=False),
+            sa.Column('owner_id', sa.Integer(), nullable=False),
+            sa.Column('day', sa.Date(), nullable=False),
+            sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('entity', 'owner_id', 'day', name='uq_stat_counter_bucket'),
+        )
+
+
+def downgrade():
+    if _has_table('stat_counter'):
+        op.drop_table('stat_counter')
+    if _has_table('match_result'):
+        op.drop_table('match_result')
+    if 'detected_language' in _columns('cv'):
+        with op.batch_alter_table('cv') as batch_op:
+            batch_op.drop_column('detected_language')
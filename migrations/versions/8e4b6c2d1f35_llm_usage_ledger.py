@@ -0,0 +1,57 @@
+"""LLM usage ledger table
+
+One row per LLM call or match cache hit with tokens, estimated cost,
+latency, retry attempt and cache status. Skipped when the table already
+exists (created by schema_full.sql or db.create_all()).
+
+Revision ID: 8e4b6c2d1f35
+Revises: 3c1f2a9d7b10
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4b6c2d1f35'
+down_revision = '3c1f2a9d7b10'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('idx_llm_usage_created', ['created_at']),
+    ('idx_llm_usage_user_created', ['user_id', 'created_at']),
+    ('idx_llm_usage_job_created', ['job_id', 'created_at']),
+]
+
+
+def upgrade():
+    if sa.inspect(op.get_bind()).has_table('llm_usage'):
+        return
+    op.create_table(
+        'llm_usage',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('kind', sa.String(length=30), nullable=False),
+        sa.Column('model', sa.String(length=50), nullable=True),
+        sa.Column('cache', sa.String(length=10), nullable=False),
+        sa.Column('status', sa.String(length=10), nullable=False),
+        sa.Column('attempt', sa.Integer(), nullable=False),
+        sa.Column('prompt_tokens', sa.Integer(), nullable=False),
+        sa.Column('completion_tokens', sa.Integer(), nullable=False),
+        sa.Column('tokens_estimated', sa.Boolean(), nullable=True),
+        sa.Column('cost_usd', sa.Float(), nullable=True),
+        sa.Column('latency_ms', sa.Float(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('job_id', sa.Integer(), nullable=True),
+        sa.Column('cv_id', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    for name, columns in INDEXES:
+        op.create_index(name, 'llm_usage', columns)
+
+
+def downgrade():
+    if sa.inspect(op.get_bind()).has_table('llm_usage'):
+        op.drop_table('llm_usage')
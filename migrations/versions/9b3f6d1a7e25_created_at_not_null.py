@@ -0,0 +1,46 @@
+"""Backfill and require cv.created_at and job.created_at
+
+Lists and the batch matcher page with keyset predicates on (created_at, id);
+a row with NULL created_at never satisfies them and was unreachable past the
+first page. NULLs are backfilled from updated_at (or the current UTC time,
+bound from Python like the model defaults, when that is NULL too) before the
+columns become NOT NULL. Run
+`flask --app app reconcile-stats` afterwards so the per-day counters include
+the backfilled rows.
+
+Revision ID: 9b3f6d1a7e25
+Revises: 5a7d3e9c2b48
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b3f6d1a7e25'
+down_revision = '5a7d3e9c2b48'
+branch_labels = None
+depends_on = None
+
+TABLES = ('cv', 'job')
+
+
+def upgrade():
+    # Not CURRENT_TIMESTAMP: that is session-local time on MySQL, the app writes UTC
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    for table in TABLES:
+        op.get_bind().execute(
+            sa.text(f"UPDATE {table} SET created_at = COALESCE(updated_at, :now) WHERE created_at IS NULL"),
+            {'now': now},
+        )
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=True)
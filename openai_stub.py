@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Local OpenAI-compatible stub server for offline tests and benchmarks.
+
+Implements POST /v1/chat/completions (streaming and blocking) and
+POST /v1/responses with canned outputs shaped like the real call sites:
+15-criterion rubric match results, CV extraction JSON, field repairs and
+OCR text. Latency, 5xx and 429 rates, and truncated or malformed JSON are
+configurable. Outcomes are derived from the seed and the request body, so a
+run replays the same way regardless of request order or concurrency.
+GET /stats returns request counters.
+
+Point the app at it with OPENAI_API_BASE=http://127.0.0.1:8765/v1 (any
+OPENAI_API_KEY value works).
+
+Run:  python openai_stub.py --port 8765 --latency lognormal:-0.5,0.4 --token-ms 5 --rate-limit-rate 0.05 --truncate-rate 0.02
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from synthetic_data import SyntheticDataset, cv_document_lines
+
+# Criteria and weights of the default matching rubric (DEFAULT_MATCHING_CRITERIA in app.py)
+RUBRIC = [
+    ("Seniority / Level", 3), ("Core Skills", 3), ("Ngôn ngữ yêu cầu", 3), ("Địa điểm / Work model", 3),
+    ("Visa / Quyền lao động", 3), ("Secondary Skills", 2), ("Số năm kinh nghiệm", 2), ("Recency", 2),
+    ("Domain / Industry", 2), ("Thành tích / KPI", 2), ("Stack / Tool version", 2), ("Soft skills", 1),
+    ("Culture / Process fit", 1), ("Extra languages", 1), ("Certificates", 1),
+]
+_CRITERION_SCORES = (0, 50, 70, 100, 100)
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.]+')
+_PHONE_RE = re.compile(r'\+?\d[\d .-]{7,}\d')
+_MALFORMATIONS = ('fence', 'prose', 'trailing_comma')
+
+
+class Latency:
+    """Delay distribution parsed from 'fixed:S', 'uniform:LOW,HIGH', 'normal:MEAN,SD' or 'lognormal:MU,SIGMA' (seconds)."""
+
+    KINDS = ('fixed', 'uniform', 'normal', 'lognormal')
+
+    def __init__(self, spec='fixed:0'):
+        kind, _, args = spec.partition(':')
+        try:
+            self.params = [float(v) for v in args.split(',') if v.strip()]
+        except ValueError:
+            raise ValueError(f"Invalid latency {spec!r}") from None
+        expected = 1 if kind == 'fixed' else 2
+        if kind not in self.KINDS or len(self.params) != expected:
+            raise ValueError(f"Invalid latency {spec!r}; use fixed:S, uniform:LOW,HIGH, normal:MEAN,SD or lognormal:MU,SIGMA")
+        self.kind = kind
+        self.spec = spec
+
+    def sample(self, rng):
+        if self.kind == 'fixed':
+            value = self.params[0]
+        elif self.kind == 'uniform':
+            value = rng.uniform(*self.params)
+        elif self.kind == 'normal':
+            value = rng.gauss(*self.params)
+        else:
+            value = rng.lognormvariate(*self.params)
+        return max(0.0, value)
+
+
+class StubConfig:
+    """Fault and latency settings; rates are probabilities per request."""
+
+    def __init__(self, seed=0, latency='fixed:0', token_ms=0.0, error_rate=0.0, rate_limit_rate=0.0,
+                 truncate_rate=0.0, malformed_rate=0.0, retry_after=1, chunk_chars=24):
+        self.seed = seed
+        self.latency = latency if isinstance(latency, Latency) else Latency(latency)
+        self.token_ms = token_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.truncate_rate = truncate_rate
+        self.malformed_rate = malformed_rate
+        self.retry_after = retry_after
+        self.chunk_chars = chunk_chars
+
+
+def estimate_tokens(text):
+    return max(1, math.ceil(len(text) / 4))
+
+
+def _text_of(content):
+    """Plain text of a chat message content (string or list of parts)."""
+    if isinstance(content, list):
+        return '\n'.join(part.get('text', '') for part in content if isinstance(part, dict))
+    return content or ''
+
+
+def match_result(cv_text, job_text):
+    """Rubric-shaped match result; scores are a stable function of the CV and JD text."""
+    breakdown = []
+    total = 0
+    for criterion, weight in RUBRIC:
+        digest = hashlib.md5(f"{criterion}\0{cv_text}\0{job_text}".encode()).digest()
+        score = _CRITERION_SCORES[digest[0] % len(_CRITERION_SCORES)]
+        total += score * weight
+        breakdown.append({
+            "criterion": criterion, "score": score, "weight": weight, "weighted_score": score * weight,
+            "explain": f"Mức đáp ứng {score}% cho tiêu chí {criterion.lower()}.",
+        })
+    strong = [c['criterion'] for c in breakdown if c['score'] == 100][:3]
+    weak = [c['criterion'] for c in breakdown if c['score'] == 0][:3]
+    return {
+        "match_score": round(total / sum(w for _, w in RUBRIC)),
+        "analysis": "Ứng viên đáp ứng phần lớn yêu cầu chính của JD." if total >= 2100 else
+                    "Ứng viên chỉ đáp ứng một phần yêu cầu của JD.",
+        "strengths": [f"Đáp ứng tốt: {name}" for name in strong] or ["Có nền tảng phù hợp"],
+        "weaknesses": [f"Chưa đáp ứng: {name}" for name in weak] or ["Không có khoảng trống lớn"],
+        "recommendations": ["Phỏng vấn kỹ thuật để xác nhận kỹ năng cốt lõi"],
+        "criteria_breakdown": breakdown,
+    }
+
+
+def cv_extraction(prompt):
+    """CV extraction JSON pulled from the CV text with simple heuristics (fits seed_scale PDFs)."""
+    text = prompt.split('CV Text:', 1)[-1].strip()
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+
+    def section(heading):
+        if heading in lines:
+            start = lines.index(heading) + 1
+            body = []
+            for line in lines[start:]:
+                if line.isupper() and len(line) < 30:
+                    break
+                body.append(line)
+            return ' '.join(body)
+        return ''
+
+    skills = section('SKILLS')
+    years = re.search(r'(\d+) years? of experience', text)
+    seniority = re.search(r'\b(Entry|Mid|Senior|Lead)\b', text)
+    email = _EMAIL_RE.search(text)
+    phone = _PHONE_RE.search(text)
+    return {
+        "name": lines[0][:100] if lines else "",
+        "email": email.group() if email else "",
+        "phone": phone.group() if phone else "",
+        "address": "",
+        "education": section('EDUCATION'),
+        "experience": section('EXPERIENCE')[:1000],
+        "skills": skills,
+        "seniority": seniority.group() if seniority else "",
+        "core_skills": ', '.join(skills.split(', ')[:5]),
+        "languages": section('LANGUAGES'),
+        "work_model": "",
+        "visa_status": "",
+        "secondary_skills": ', '.join(skills.split(', ')[5:]),
+        "years_experience": int(years.group(1)) if years else None,
+        "recency_years": 1,
+        "domain": "",
+        "kpi": "",
+        "stack_versions": "",
+        "soft_skills": "",
+        "culture_process": "",
+    }
+
+
+def repair_fields(messages, prompt):
+    """Only the keys a repair prompt asks for, taken from the canned object of the original request."""
+    try:
+        properties = json.loads(prompt[prompt.index('{'):])
+    except ValueError:
+        properties = {}
+    original = _chat_output(messages[:-2]) if len(messages) > 2 else {}
+    return {key: original.get(key) if isinstance(original, dict) else None for key in properties}
+
+
+def _chat_output(messages):
+    """Canned assistant output for a chat request: a dict (JSON) or a string."""
+    last = _text_of(messages[-1].get('content')) if messages else ''
+    if last.startswith('Your previous JSON was missing'):
+        return repair_fields(messages, last)
+    if last.startswith('CV:\n') and '\n\nJD:\n' in last:
+        cv_text, _, job_text = last[4:].partition('\n\nJD:\n')
+        return match_result(cv_text, job_text.split('\n\n')[0])
+    if 'Extract CV info' in last:
+        return cv_extraction(last)
+    return "OK"
+
+
+def ocr_text(image_digest, seed):
+    """Resume text for an OCR request; one synthetic CV per distinct image."""
+    dataset = SyntheticDataset(seed=f"{seed}:{image_digest}")
+    return '\n'.join(cv_document_lines(next(dataset.cvs(1))))
+
+
+def malform(content, how):
+    if how == 'fence':
+        return f"```json\n{content}\n```"
+    if how == 'prose':
+        return f"Here is the JSON you asked for:\n{content}"
+    return re.sub(r'\s*}\s*$', ',\n}', content, count=1)  # trailing comma
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config, verbose=False):
+        super().__init__(address, StubHandler)
+        self.config = config
+        self.verbose = verbose
+        self.stats = Counter()
+        self._seen = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def request_rng(self, body):
+        """RNG for one request: same body and attempt number -> same outcome."""
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            attempt = self._seen[digest]
+            self._seen[digest] += 1
+        return random.Random(f"{self.config.seed}:{digest}:{attempt}")
+
+    def count(self, *keys):
+        with self._lock:
+            for key in keys:
+                self.stats[key] += 1
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = 'openai-stub/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/stats':
+            with self.server._lock:
+                stats = dict(self.server.stats)
+            return self._send_json(200, stats)
+        if self.path.rstrip('/') == '/v1/models':
+            return self._send_json(200, {"object": "list", "data": [{"id": "stub", "object": "model"}]})
+        self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        try:
+            request = json.loads(body or b'{}')
+        except ValueError:
+            return self._send_json(400, {"error": {"message": "Invalid JSON body", "type": "invalid_request_error"}})
+        path = self.path.rstrip('/')
+        if path not in ('/v1/chat/completions', '/v1/responses'):
+            return self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+
+        config = self.server.config
+        rng = self.server.request_rng(body)
+        endpoint = path.rsplit('/', 1)[-1]
+        self.server.count('requests', f"{endpoint}.requests")
+        time.sleep(config.latency.sample(rng))
+
+        roll = rng.random()
+        if roll < config.rate_limit_rate:
+            self.server.count('rate_limited')
+            return self._send_json(429, {"error": {
+                "message": "Rate limit reached (stub)", "type": "requests", "code": "rate_limit_exceeded"}},
+                headers={'Retry-After': config.retry_after})
+        if roll < config.rate_limit_rate + config.error_rate:
+            self.server.count('server_errors')
+            return self._send_json(500, {"error": {"message": "The server had an error (stub)", "type": "server_error"}})
+
+        if endpoint == 'responses':
+            return self._responses(request, rng)
+        return self._chat_completions(request, rng)
+
+    def _content(self, output, rng):
+        """Serialize canned output, applying truncation/malformation faults; returns (text, finish_reason)."""
+        if not isinstance(output, dict):
+            return output, 'stop'
+        config = self.server.config
+        content = json.dumps(output, ensure_ascii=False)
+        roll = rng.random()
+        if roll < config.truncate_rate:
+            self.server.count('truncated')
+            return content[:rng.randint(len(content) // 4, len(content) * 3 // 4)], 'length'
+        if roll < config.truncate_rate + config.malformed_rate:
+            self.server.count('malformed')
+            return malform(content, rng.choice(_MALFORMATIONS)), 'stop'
+        return content, 'stop'
+
+    def _chat_completions(self, request, rng):
+        messages = request.get('messages') or []
+        content, finish_reason = self._content(_chat_output(messages), rng)
+        model = request.get('model', 'stub')
+        prompt_tokens = sum(estimate_tokens(_text_of(m.get('content'))) for m in messages)
+        completion_tokens = estimate_tokens(content)
+        completion_id = f"chatcmpl-{uuid.UUID(int=rng.getrandbits(128)).hex}"
+        token_seconds = self.server.config.token_ms / 1000
+
+        if not request.get('stream'):
+            time.sleep(completion_tokens * token_seconds)
+            return self._send_json(200, {
+                "id": completion_id, "object": "chat.completion", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                             "finish_reason": finish_reason}],
+                "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                          "total_tokens": prompt_tokens + completion_tokens},
+            })
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        def event(delta, finish=None):
+            chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": model, "choices": [{"index": 0, "delta": delta, "finish_reason": finish}]}
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+
+        size = self.server.config.chunk_chars
+        try:
+            event({"role": "assistant"})
+            for start in range(0, len(content), size):
+                piece = content[start:start + size]
+                time.sleep(estimate_tokens(piece) * token_seconds)
+                event({"content": piece})
+            event({}, finish_reason)
+            self.wfile.write(b"data: [DONE]\n\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.server.count('client_disconnects')
+        self.close_connection = True
+
+    def _responses(self, request, rng):
+        inputs = request.get('input')
+        parts = []
+        if isinstance(inputs, str):
+            parts = [{"type": "input_text", "text": inputs}]
+        else:
+            for message in inputs or []:
+                content = message.get('content') if isinstance(message, dict) else None
+                parts.extend(content if isinstance(content, list) else [{"type": "input_text", "text": content or ''}])
+        images = [p.get('image_url', '') for p in parts if isinstance(p, dict) and p.get('type') == 'input_image']
+        if images:
+            self.server.count('ocr')
+            text = ocr_text(hashlib.sha256(images[0].encode()).hexdigest()[:16], self.server.config.seed)
+        else:
+            text = "OK"
+        input_tokens = sum(estimate_tokens(p.get('text', '')) for p in parts if isinstance(p, dict)) + 765 * len(images)
+        output_tokens = estimate_tokens(text)
+        time.sleep(output_tokens * self.server.config.token_ms / 1000)
+        self._send_json(200, {
+            "id": f"resp_{uuid.UUID(int=rng.getrandbits(128)).hex}", "object": "response",
+            "created_at": int(time.time()), "status": "completed", "model": request.get('model', 'stub'),
+            "output": [{"type": "message", "role": "assistant", "status": "completed",
+                        "content": [{"type": "output_text", "text": text, "annotations": []}]}],
+            "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens,
+                      "total_tokens": input_tokens + output_tokens},
+        })
+
+
+def start_stub(config=None, host='127.0.0.1', port=0):
+    """Start a stub server in a daemon thread; returns the server (see .base_url, .shutdown())."""
+    server = StubServer((host, port), config or StubConfig())
+    threading.Thread(target=server.serve_forever, name='openai-stub', daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Local OpenAI-compatible stub server.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency', type=Latency, default=Latency('fixed:0'),
+                        help='Time to first token: fixed:S | uniform:LOW,HIGH | normal:MEAN,SD | lognormal:MU,SIGMA')
+    parser.add_argument('--token-ms', type=float, default=0.0, help='Extra milliseconds per output token.')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of requests answered with HTTP 500.')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Share of requests answered with HTTP 429.')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds on 429 responses.')
+    parser.add_argument('--truncate-rate', type=float, default=0.0, help='Share of JSON outputs cut off mid-document.')
+    parser.add_argument('--malformed-rate', type=float, default=0.0,
+                        help='Share of JSON outputs wrapped in fences/prose or given a trailing comma.')
+    parser.add_argument('--chunk-chars', type=int, default=24, help='Characters per streamed delta.')
+    parser.add_argument('--verbose', action='store_true', help='Log every request.')
+    args = parser.parse_args(argv)
+
+    config = StubConfig(
+        seed=args.seed, latency=args.latency, token_ms=args.token_ms, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, truncate_rate=args.truncate_rate,
+        malformed_rate=args.malformed_rate, retry_after=args.retry_after, chunk_chars=args.chunk_chars,
+    )
+    server = StubServer((args.host, args.port), config, verbose=args.verbose)
+    print(f"🧪 OpenAI stub listening on {server.base_url} (latency {config.latency.spec}, seed {config.seed})")
+    print(f"   export OPENAI_API_BASE={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Keyset (cursor) pagination over (created_at, id), newest first.
+
+Instead of OFFSET, each page continues from the last row seen: the cursor
+carries that row's created_at and id, so the query is a range scan on a
+(…, created_at, id) index and costs the same on page 1 and page 100 000.
+Cursors are opaque URL-safe strings; an invalid cursor restarts from the
+first page instead of raising. created_at must be NOT NULL: the strict
+comparisons never match a NULL, so such rows would be skipped.
+"""
+
+import base64
+import json
+import math
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+MAX_PER_PAGE = 100
+
+
+def encode_cursor(row, direction, page):
+    """Cursor continuing after (direction 'n') or before ('p') row."""
+    payload = {
+        't': row.created_at.isoformat() if row.created_at else None,
+        'i': row.id,
+        'd': direction,
+        'p': page,
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return (created_at, id, direction, page) or None for a missing or malformed cursor."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        created_at = datetime.fromisoformat(payload['t']) if payload.get('t') else None
+        direction = payload.get('d', 'n')
+        if direction not in ('n', 'p'):
+            return None
+        return created_at, int(payload['i']), direction, max(int(payload.get('p', 1)), 1)
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+class KeysetPage:
+    """One page of keyset results.
+
+    Exposes the attributes the list templates use from Flask-SQLAlchemy's
+    Pagination (items, page, per_page, total, pages, has_prev, has_next)
+    plus prev_cursor/next_cursor. total and pages are None when the count
+    was skipped.
+    """
+
+    def __init__(self, items, page, per_page, total, prev_cursor, next_cursor):
+        self.items = items
+        self.page = page
+        self.per_page = per_page
+        self.total = total
+        self.prev_cursor = prev_cursor
+        self.next_cursor = next_cursor
+
+    @property
+    def pages(self):
+        if self.total is None:
+            return None
+        return max(math.ceil(self.total / self.per_page), 1) if self.per_page else 0
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def first(self):
+        """1-based position of the first item on this page."""
+        return (self.page - 1) * self.per_page + 1 if self.items else 0
+
+    @property
+    def last(self):
+        return self.first + len(self.items) - 1 if self.items else 0
+
+
+def _after(model, created_at, row_id):
+    return or_(model.created_at < created_at, and_(model.created_at == created_at, model.id < row_id))
+
+
+def _before(model, created_at, row_id):
+    return or_(model.created_at > created_at, and_(model.created_at == created_at, model.id > row_id))
+
+
+def keyset_paginate(query, model, cursor=None, per_page=10, total=None, page=1):
+    """Fetch one newest-first page of query.
+
+    query must not be ordered yet. total is an already known row count (e.g.
+    from the statistics counters) or None to skip counting. Without a cursor,
+    page > 1 is honoured once with an OFFSET so old ?page=N links keep
+    working; the returned cursors continue with keyset from there.
+    """
+    per_page = min(max(per_page, 1), MAX_PER_PAGE)
+    decoded = decode_cursor(cursor)
+    newest_first = (model.created_at.desc(), model.id.desc())
+
+    if decoded and decoded[0] is not None:
+        created_at, row_id, direction, page = decoded
+        if direction == 'n':
+            rows = query.filter(_after(model, created_at, row_id)).order_by(*newest_first).limit(per_page + 1).all()
+            has_more_after = len(rows) > per_page
+            items = rows[:per_page]
+            has_more_before = True
+        else:
+            rows = query.filter(_before(model, created_at, row_id)).order_by(
+                model.created_at.asc(), model.id.asc()
+            ).limit(per_page + 1).all()
+            has_more_before = len(rows) > per_page
+            items = list(reversed(rows[:per_page]))
+            has_more_after = True
+            if not has_more_before:
+                page = 1
+    else:
+        page = max(page, 1)
+        offset = (page - 1) * per_page
+        rows = query.order_by(*newest_first).offset(offset).limit(per_page + 1).all()
+        if not rows and page > 1:
+            page = 1
+            offset = 0
+            rows = query.order_by(*newest_first).limit(per_page + 1).all()
+        has_more_after = len(rows) > per_page
+        items = rows[:per_page]
+        has_more_before = offset > 0
+
+    prev_cursor = encode_cursor(items[0], 'p', page - 1) if items and has_more_before else None
+    next_cursor = encode_cursor(items[-1], 'n', page + 1) if items and has_more_after else None
+    return KeysetPage(items, page, per_page, total, prev_cursor, next_cursor)
+
+
+def iter_keyset(query, model, chunk_size=500):
+    """Yield rows of query newest first, fetching chunk_size rows per keyset query."""
+    last = None
+    while True:
+        chunk_query = query
+        if last is not None:
+            chunk_query = chunk_query.filter(_after(model, *last))
+        rows = chunk_query.order_by(model.created_at.desc(), model.id.desc()).limit(chunk_size).all()
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        last = (rows[-1].created_at, rows[-1].id)
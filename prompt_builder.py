@@ -0,0 +1,111 @@
+"""
+Compact, token-budgeted prompts for CV/JD matching.
+
+The instructions, output format and rubric form a static system message that
+is built once and sent unchanged for every pair; only the CV/JD text (and
+custom criteria) vary, in the user message.
+Free-text fields are whitespace-compacted and truncated to per-section token
+budgets.
+"""
+
+import json
+import re
+import textwrap
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken is optional; fall back to a character estimate
+    _ENCODING = None
+
+# Per-section token budgets for free-text fields; unlisted fields use DEFAULT_BUDGET
+SECTION_BUDGETS = {
+    'experience': 700,
+    'education': 150,
+    'skills': 150,
+    'address': 40,
+    'description': 500,
+    'requirements': 400,
+    'criteria': 500,
+}
+DEFAULT_BUDGET = 40
+
+_INLINE_WS_RE = re.compile(r'[ \t\u00a0]+')
+_BLANK_LINES_RE = re.compile(r'\n{2,}')
+
+
+def estimate_tokens(text: str) -> int:
+    """Count tokens with tiktoken when installed, else estimate from characters."""
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    non_ascii = sum(1 for ch in text if not ch.isascii())
+    # ~4 chars/token for ASCII; Vietnamese diacritics split into far smaller tokens
+    return int((len(text) - non_ascii) / 4 + non_ascii / 1.5) + 1
+
+
+def compact_text(text: str) -> str:
+    """Dedent and collapse redundant whitespace while keeping line structure."""
+    if not text:
+        return ''
+    text = textwrap.dedent(str(text)).replace('\r\n', '\n')
+    lines = [_INLINE_WS_RE.sub(' ', line).strip() for line in text.split('\n')]
+    return _BLANK_LINES_RE.sub('\n', '\n'.join(lines)).strip()
+
+
+def truncate_tokens(text: str, budget: int) -> str:
+    """Truncate text to roughly budget tokens, cutting at a word boundary."""
+    tokens = estimate_tokens(text)
+    if tokens <= budget:
+        return text
+    cut = max(1, int(len(text) * budget / tokens))
+    head = text[:cut]
+    space = head.rfind(' ')
+    if space > cut // 2:
+        head = head[:space]
+    return head.rstrip() + ' …'
+
+
+def format_section(fields, budgets=None):
+    """Render (key, label, value) triples as 'Label: value' lines within budget.
+
+    Empty values are skipped instead of rendering 'None'.
+    """
+    budgets = budgets or SECTION_BUDGETS
+    lines = []
+    for key, label, value in fields:
+        if value is None or value == '':
+            continue
+        value = compact_text(str(value)).replace('\n', '; ')
+        if not value:
+            continue
+        lines.append(f"{label}: {truncate_tokens(value, budgets.get(key, DEFAULT_BUDGET))}")
+    return '\n'.join(lines)
+
+
+class MatchPromptBuilder:
+    """Build chat messages for a match from a static system message and a per-pair user message."""
+
+    def __init__(self, instructions: str, output_example: dict, rubric: str, rubric_heading: str,
+                 criteria_heading: str, system_rule: str):
+        example = json.dumps(output_example, ensure_ascii=False, separators=(',', ':'))
+        head = f"{system_rule}\n{compact_text(instructions)}\n{example}"
+        self.system_with_rubric = f"{head}\n\n{rubric_heading}\n{compact_text(rubric)}"
+        self.system_without_rubric = head
+        self.criteria_heading = criteria_heading
+
+    def messages(self, cv_text: str, job_text: str, criteria: str = ''):
+        """Chat messages for one pair; custom criteria replace the default rubric."""
+        criteria = compact_text(criteria)
+        user = f"CV:\n{cv_text}\n\nJD:\n{job_text}"
+        if criteria:
+            user += f"\n\n{self.criteria_heading}\n{truncate_tokens(criteria, SECTION_BUDGETS['criteria'])}"
+        return [
+            {"role": "system", "content": self.system_without_rubric if criteria else self.system_with_rubric},
+            {"role": "user", "content": user}
+        ]
+
+    @staticmethod
+    def count(messages) -> int:
+        return sum(estimate_tokens(m['content']) for m in messages)
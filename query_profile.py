@@ -0,0 +1,77 @@
+"""
+Query-level instrumentation: statement count, time and result payload size.
+
+QueryRecorder hooks the engine's cursor events for the duration of a with
+block; payload_bytes estimates how many bytes of column data a result
+carried, so list views can be compared with and without deferred columns.
+"""
+
+import time
+from decimal import Decimal
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Row
+
+
+class QueryRecorder:
+    """Record every statement executed on engine inside a with block.
+
+        with QueryRecorder(db.engine) as rec:
+            ...
+        rec.count, rec.seconds, rec.statements  # [(sql, seconds), ...]
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+        self._started = []
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        self._started.append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = self._started.pop() if self._started else time.perf_counter()
+        self.statements.append((statement, time.perf_counter() - started))
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._before)
+        event.listen(self.engine, 'after_cursor_execute', self._after)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        event.remove(self.engine, 'before_cursor_execute', self._before)
+        event.remove(self.engine, 'after_cursor_execute', self._after)
+        return False
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    @property
+    def seconds(self):
+        return sum(seconds for _, seconds in self.statements)
+
+
+def _value_bytes(value):
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (bool, int, float, Decimal)):
+        return 8
+    return len(str(value))
+
+
+def payload_bytes(rows):
+    """Approximate column bytes held by ORM objects or result rows (loaded attributes only)."""
+    total = 0
+    for row in rows:
+        if isinstance(row, Row):
+            values = tuple(row)
+        else:
+            state = inspect(row, raiseerr=False)
+            values = state.dict.values() if state is not None else (row,)
+        total += sum(_value_bytes(value) for value in values if not isinstance(value, (list, dict, set)))
+    return total
@@ -0,0 +1,235 @@
+"""
+Opt-in profiling of slow requests.
+
+A sampled request registers its thread with one shared sampler thread, which
+reads the thread's stack every interval via sys._current_frames(); the
+request itself runs uninstrumented, so a low sample rate costs close to
+nothing. When a sampled request takes at least threshold seconds, its stacks
+are saved as a speedscope file (https://www.speedscope.app). A request sent
+with "X-Profile: 1" is always sampled and saved, and "X-Profile: cprofile"
+runs it under cProfile and saves a .pstats file instead; both headers are
+honoured only for callers allowed by the app (admins or a token).
+"""
+
+import cProfile
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+
+from flask import g, request
+
+PROFILE_SUFFIXES = ('.speedscope.json', '.pstats')
+_NAME_PATTERN = re.compile(r'^(?P<ts>\d{8}T\d{6})_(?P<endpoint>[\w.-]+)_(?P<ms>\d+)ms_(?P<id>[0-9a-f]+)(?P<suffix>\..+)$')
+
+
+class _Recording:
+    __slots__ = ('stacks', 'samples')
+
+    def __init__(self):
+        self.stacks = Counter()
+        self.samples = 0
+
+
+class StackSampler:
+    """One daemon thread sampling the stacks of registered threads."""
+
+    def __init__(self, interval=0.01, max_depth=128, max_samples=100000):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.max_samples = max_samples
+        self._active = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self, thread_id):
+        recording = _Recording()
+        with self._lock:
+            self._active[thread_id] = recording
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return recording
+
+    def stop(self, thread_id):
+        with self._lock:
+            return self._active.pop(thread_id, None)
+
+    @property
+    def active(self):
+        return len(self._active)
+
+    def _stack(self, frame):
+        stack = []
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+        stack.reverse()
+        return tuple(stack)
+
+    def _run(self):
+        while True:
+            if not self._active:
+                self._wake.clear()
+                if not self._active:
+                    self._wake.wait()
+            time.sleep(self.interval)
+            frames = sys._current_frames()
+            with self._lock:
+                active = list(self._active.items())
+            for thread_id, recording in active:
+                frame = frames.get(thread_id)
+                if frame is not None and recording.samples < self.max_samples:
+                    recording.stacks[self._stack(frame)] += 1
+                    recording.samples += 1
+            del frames
+
+
+def speedscope_document(name, recording, interval, duration):
+    """Sampled-profile speedscope JSON for a recording."""
+    frames, frame_index, samples, weights = [], {}, [], []
+    for stack, count in recording.stacks.most_common():
+        indexes = []
+        for key in stack:
+            if key not in frame_index:
+                frame_index[key] = len(frames)
+                frames.append({'name': key[0], 'file': key[1], 'line': key[2]})
+            indexes.append(frame_index[key])
+        samples.append(indexes)
+        weights.append(round(count * interval, 6))
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': name,
+        'exporter': 'jobfit request_profiler',
+        'shared': {'frames': frames},
+        'profiles': [{
+            'type': 'sampled',
+            'name': name,
+            'unit': 'seconds',
+            'startValue': 0,
+            'endValue': round(max(duration, sum(weights)), 6),
+            'samples': samples,
+            'weights': weights,
+        }],
+    }
+
+
+class RequestProfiler:
+    """Chooses which requests to profile and keeps the saved profiles in profile_dir."""
+
+    def __init__(self, profile_dir, sample_rate=0.01, threshold=5.0, interval=0.01, max_concurrent=4,
+                 max_files=200, token=None):
+        self.profile_dir = profile_dir
+        self.sample_rate = sample_rate
+        self.threshold = threshold
+        self.max_concurrent = max_concurrent
+        self.max_files = max_files
+        self.token = token
+        self.sampler = StackSampler(interval)
+        self.allow_header = lambda: False
+
+    def init_app(self, app, allow_header=None):
+        """Register the request hooks; allow_header() decides who may force profiling with X-Profile."""
+        if allow_header is not None:
+            self.allow_header = allow_header
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+
+    def _header_mode(self):
+        mode = request.headers.get('X-Profile', '').strip().lower()
+        if not mode:
+            return None
+        token = request.headers.get('X-Profile-Token')
+        if not ((self.token and token == self.token) or self.allow_header()):
+            return None
+        return 'cprofile' if mode == 'cprofile' else 'sample'
+
+    def _before_request(self):
+        forced = self._header_mode()
+        if forced is None and (not self.sample_rate or random.random() >= self.sample_rate):
+            return
+        if forced is None and self.sampler.active >= self.max_concurrent:
+            return
+        g.profile = {'mode': forced or 'sample', 'forced': forced is not None, 'started': time.perf_counter()}
+        if forced == 'cprofile':
+            g.profile['profiler'] = cProfile.Profile()
+            g.profile['profiler'].enable()
+        else:
+            g.profile['recording'] = self.sampler.start(threading.get_ident())
+
+    def _teardown_request(self, exc=None):
+        profile = g.pop('profile', None)
+        if profile is None:
+            return
+        duration = time.perf_counter() - profile['started']
+        if profile['mode'] == 'cprofile':
+            profile['profiler'].disable()
+        else:
+            self.sampler.stop(threading.get_ident())
+        if not profile['forced'] and duration < self.threshold:
+            return
+        try:
+            self.save(profile, request.endpoint or 'unmatched', f"{request.method} {request.path}", duration)
+        except OSError:
+            pass
+
+    def save(self, profile, endpoint, title, duration):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+        endpoint = re.sub(r'[^\w.-]', '_', endpoint)
+        base = f"{stamp}_{endpoint}_{int(duration * 1000)}ms_{uuid.uuid4().hex[:8]}"
+        if profile['mode'] == 'cprofile':
+            path = os.path.join(self.profile_dir, base + '.pstats')
+            profile['profiler'].dump_stats(path)
+        else:
+            path = os.path.join(self.profile_dir, base + '.speedscope.json')
+            document = speedscope_document(title, profile['recording'], self.sampler.interval, duration)
+            with open(path, 'w', encoding='utf-8') as handle:
+                json.dump(document, handle)
+        self._prune()
+        return path
+
+    def _prune(self):
+        names = sorted(entry['name'] for entry in self.list_profiles())
+        for name in names[:max(len(names) - self.max_files, 0)]:
+            try:
+                os.remove(os.path.join(self.profile_dir, name))
+            except OSError:
+                pass
+
+    def list_profiles(self):
+        """Saved profiles, newest first, with the endpoint and duration encoded in their names."""
+        if not os.path.isdir(self.profile_dir):
+            return []
+        profiles = []
+        for entry in os.scandir(self.profile_dir):
+            match = _NAME_PATTERN.match(entry.name)
+            if not match or match.group('suffix') not in PROFILE_SUFFIXES:
+                continue
+            profiles.append({
+                'name': entry.name,
+                'endpoint': match.group('endpoint'),
+                'duration_ms': int(match.group('ms')),
+                'format': 'pstats' if match.group('suffix') == '.pstats' else 'speedscope',
+                'size': entry.stat().st_size,
+                'created_at': datetime.strptime(match.group('ts'), '%Y%m%dT%H%M%S').replace(tzinfo=timezone.utc).isoformat(),
+            })
+        profiles.sort(key=lambda item: item['name'], reverse=True)
+        return profiles
+
+    def path_for(self, name):
+        """Absolute path of a saved profile, or None for names that are not saved profiles."""
+        match = _NAME_PATTERN.match(name)
+        if not match or match.group('suffix') not in PROFILE_SUFFIXES:
+            return None
+        path = os.path.join(os.path.abspath(self.profile_dir), name)
+        return path if os.path.isfile(path) else None
@@ -5,7 +5,7 @@ JobFit Analytics - Main Application Runner
 
 import os
 import sys
-from app import app, db
+from app import app, create_app, db
 
 def create_tables():
     """Create database tables if they don't exist"""
@@ -32,9 +32,12 @@ def create_tables():
 def main():
     """Main application entry point"""
     print("🚀 Starting JobFit Analytics...")
+    create_app()
     
-    # Create database tables
-    create_tables()
+    # Create database tables and the default admin only when asked: these are round trips
+    # to the database on every start, and the schema is normally managed with migrations
+    if '--init-db' in sys.argv or os.environ.get('INIT_DB', 'false').lower() == 'true':
+        create_tables()
     
     # Get configuration
     host = os.environ.get('FLASK_HOST', '0.0.0.0')
@@ -5,6 +5,9 @@ SET NAMES utf8mb4;
 SET FOREIGN_KEY_CHECKS = 0;
 
 -- Drop existing tables (order matters due to FK)
+DROP TABLE IF EXISTS `match_result`;
+DROP TABLE IF EXISTS `stat_counter`;
+DROP TABLE IF EXISTS `llm_usage`;
 DROP TABLE IF EXISTS `cv`;
 DROP TABLE IF EXISTS `job`;
 DROP TABLE IF EXISTS `settings`;
@@ -42,7 +45,7 @@ CREATE TABLE `job` (
   `education_required` VARCHAR(100) NULL,
   `is_active` TINYINT(1) DEFAULT 1,
   `user_id` INT NULL,
-  `created_at` DATETIME NULL,
+  `created_at` DATETIME NOT NULL,
   `updated_at` DATETIME NULL,
 
   -- Matching Criteria (JD-side, 13 fields)
@@ -61,7 +64,10 @@ CREATE TABLE `job` (
   `criteria_culture_process` VARCHAR(100) NULL,
 
   PRIMARY KEY (`id`),
-  KEY `idx_job_user_id` (`user_id`),
+  KEY `idx_job_active_created` (`is_active`, `created_at`, `id`),
+  KEY `idx_job_user_active_created` (`user_id`, `is_active`, `created_at`, `id`),
+  KEY `idx_job_created` (`created_at`, `id`),
+  KEY `idx_job_active_deadline` (`is_active`, `application_deadline`),
   CONSTRAINT `fk_job_user` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`) ON DELETE SET NULL ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
@@ -77,8 +83,9 @@ CREATE TABLE `cv` (
   `skills` TEXT NULL,
   `file_path` VARCHAR(200) NULL,
   `avatar` VARCHAR(200) NULL,
+  `detected_language` VARCHAR(10) NULL,
   `user_id` INT NULL,
-  `created_at` DATETIME NULL,
+  `created_at` DATETIME NOT NULL,
   `updated_at` DATETIME NULL,
 
   -- Matching Criteria (CV-side, 13 fields)
@@ -97,10 +104,65 @@ CREATE TABLE `cv` (
   `cv_culture_process` VARCHAR(100) NULL,
 
   PRIMARY KEY (`id`),
-  KEY `idx_cv_user_id` (`user_id`),
+  KEY `idx_cv_created` (`created_at`, `id`),
+  KEY `idx_cv_user_created` (`user_id`, `created_at`, `id`),
   CONSTRAINT `fk_cv_user` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`) ON DELETE SET NULL ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+-- MATCH RESULT (stored CV/JD match analyses)
+CREATE TABLE `match_result` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `cv_id` INT NOT NULL,
+  `job_id` INT NOT NULL,
+  `criteria_hash` VARCHAR(32) NOT NULL,
+  `input_fingerprint` VARCHAR(64) NOT NULL,
+  `model` VARCHAR(50) NULL,
+  `match_score` INT NOT NULL DEFAULT 0,
+  `result` JSON NULL,
+  `llm_seconds` FLOAT NULL,
+  `created_at` DATETIME NULL,
+  `updated_at` DATETIME NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `uq_match_result_pair` (`cv_id`, `job_id`, `criteria_hash`),
+  KEY `idx_match_result_job_score` (`job_id`, `match_score`),
+  CONSTRAINT `fk_match_result_cv` FOREIGN KEY (`cv_id`) REFERENCES `cv` (`id`) ON DELETE CASCADE,
+  CONSTRAINT `fk_match_result_job` FOREIGN KEY (`job_id`) REFERENCES `job` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- STAT COUNTER (materialized CV/job counts per owner and day; rebuild with `flask --app app reconcile-stats`)
+CREATE TABLE `stat_counter` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `entity` VARCHAR(20) NOT NULL,
+  `owner_id` INT NOT NULL,
+  `day` DATE NOT NULL,
+  `count` INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `uq_stat_counter_bucket` (`entity`, `owner_id`, `day`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- LLM USAGE (per-call token/cost ledger; plain ids so history outlives deleted rows)
+CREATE TABLE `llm_usage` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `created_at` DATETIME NOT NULL,
+  `kind` VARCHAR(30) NOT NULL,
+  `model` VARCHAR(50) NULL,
+  `cache` VARCHAR(10) NOT NULL DEFAULT 'miss',
+  `status` VARCHAR(10) NOT NULL DEFAULT 'ok',
+  `attempt` INT NOT NULL DEFAULT 0,
+  `prompt_tokens` INT NOT NULL DEFAULT 0,
+  `completion_tokens` INT NOT NULL DEFAULT 0,
+  `tokens_estimated` TINYINT(1) DEFAULT 0,
+  `cost_usd` DOUBLE NULL,
+  `latency_ms` DOUBLE NULL,
+  `user_id` INT NULL,
+  `job_id` INT NULL,
+  `cv_id` INT NULL,
+  PRIMARY KEY (`id`),
+  KEY `idx_llm_usage_created` (`created_at`),
+  KEY `idx_llm_usage_user_created` (`user_id`, `created_at`),
+  KEY `idx_llm_usage_job_created` (`job_id`, `created_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 -- SETTINGS
 CREATE TABLE `settings` (
   `id` INT NOT NULL AUTO_INCREMENT,
@@ -9,7 +9,7 @@ import random
 import string
 from datetime import datetime, timedelta, timezone
 
-from app import app, db, User, CV, Job, Settings
+from app import app, db, User, CV, Job, Settings, MatchResult, reconcile_stat_counters
 
 
 def rand_str(prefix: str, n: int = 6) -> str:
@@ -153,6 +153,7 @@ def main():
     with app.app_context():
         print("Clearing existing data...")
         # Order for FK safety
+        MatchResult.query.delete()
         CV.query.delete()
         Job.query.delete()
         Settings.query.delete()
@@ -167,6 +168,8 @@ def main():
         seed_cvs(users, 20)
         print("Seeding settings...")
         seed_settings(20)
+        print("Rebuilding statistics counters...")
+        reconcile_stat_counters()
         print("Done. Seeded 20 records for each table.")
 
 
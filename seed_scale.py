@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Seed a load-test dataset: 1k to 1M synthetic CVs and jobs, plus CV PDFs.
+
+Rows come from synthetic_data.SyntheticDataset and are inserted with one Core
+executemany INSERT per chunk. The same --seed and options always produce the
+same data. Existing users, CVs, jobs and match results are deleted first.
+All seeded users have the password "password123"; user_00001 is an admin.
+
+Run:  python seed_scale.py --preset medium
+      python seed_scale.py --cvs 250000 --jobs 20000 --skills 5000 --seniority "Mid=0.5,Senior=0.5" --pdfs 100
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+from app import app, db, User, CV, Job, MatchResult, reconcile_stat_counters
+from synthetic_data import (
+    DATASET_PRESETS, DEFAULT_ANCHOR, SyntheticDataset, chunked, cv_document_lines, parse_distribution, write_pdf
+)
+
+
+def _insert(table, rows, chunk_size, label):
+    started = time.perf_counter()
+    total = 0
+    for batch in chunked(rows, chunk_size):
+        db.session.execute(table.insert(), batch)
+        db.session.commit()
+        total += len(batch)
+        print(f"   {label}: {total:,} ({total / (time.perf_counter() - started):,.0f} rows/s)", end='\r')
+    elapsed = time.perf_counter() - started
+    print(f"   {label}: {total:,} in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+    return total
+
+
+def clear_tables():
+    for model in (MatchResult, CV, Job, User):
+        db.session.query(model).delete()
+    db.session.commit()
+
+
+def _with_pdfs(rows, seed, count, pdf_dir):
+    """Pass CV rows through, writing a PDF for each of the first count rows."""
+    upload_root = os.path.abspath(app.config['UPLOAD_FOLDER'])
+    pdf_dir = os.path.abspath(pdf_dir or os.path.join(upload_root, 'cvs'))
+    os.makedirs(pdf_dir, exist_ok=True)
+    for index, row in enumerate(rows, 1):
+        # Every row needs the key: the chunk is one executemany INSERT
+        row.setdefault('file_path', None)
+        if index <= count:
+            path = os.path.join(pdf_dir, f"synthetic_{seed}_{index:07d}.pdf")
+            write_pdf(path, cv_document_lines(row))
+            if os.path.commonpath([upload_root, path]) == upload_root:
+                row['file_path'] = os.path.relpath(path, upload_root).replace(os.sep, '/')
+            if index == count:
+                print(f"   pdfs: {count:,} written to {pdf_dir}")
+        yield row
+
+
+def load_dataset(dataset, users, cvs, jobs, chunk_size=5000, pdfs=0, pdf_dir=None):
+    """Insert users, jobs and CVs from dataset (inside an app context); optionally write PDFs of the first CVs.
+
+    PDFs written under UPLOAD_FOLDER are linked to their CV through file_path.
+    """
+    hasher = User()
+    hasher.set_password('password123')  # hashing once keeps large user counts fast
+    _insert(User.__table__, dataset.users(users, hasher.password_hash), chunk_size, 'users')
+    user_ids = [row.id for row in db.session.query(User.id).order_by(User.id)] or [None]
+    _insert(Job.__table__, dataset.jobs(jobs, user_ids), chunk_size, 'jobs')
+
+    rows = dataset.cvs(cvs, user_ids)
+    if pdfs:
+        rows = _with_pdfs(rows, dataset.seed, pdfs, pdf_dir)
+    _insert(CV.__table__, rows, chunk_size, 'cvs')
+    return reconcile_stat_counters()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--preset', choices=sorted(DATASET_PRESETS), default='small',
+                        help='Row counts: ' + ', '.join(f"{k}={v[1]:,} CVs/{v[2]:,} jobs" for k, v in DATASET_PRESETS.items()))
+    parser.add_argument('--users', type=int, help='Overrides the preset.')
+    parser.add_argument('--cvs', type=int, help='Overrides the preset.')
+    parser.add_argument('--jobs', type=int, help='Overrides the preset.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skills', type=int, default=500, help='Skill vocabulary size (default 500).')
+    parser.add_argument('--seniority', type=parse_distribution, help='e.g. "Entry=0.2,Mid=0.5,Senior=0.3".')
+    parser.add_argument('--domains', type=parse_distribution, help='e.g. "Fintech=2,Healthcare=1,none=0.5".')
+    parser.add_argument('--text-scale', type=float, default=1.0, help='Multiplier for long text fields.')
+    parser.add_argument('--anchor', type=datetime.fromisoformat, default=DEFAULT_ANCHOR,
+                        help='Timestamps are spread over the year before this date (default 2025-01-01).')
+    parser.add_argument('--pdfs', type=int, default=0, help='Write PDFs for the first N CVs.')
+    parser.add_argument('--pdf-dir', help='Defaults to UPLOAD_FOLDER/cvs (PDFs there are linked to their CVs).')
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    users, cvs, jobs = DATASET_PRESETS[args.preset]
+    users = args.users if args.users is not None else users
+    cvs = args.cvs if args.cvs is not None else cvs
+    jobs = args.jobs if args.jobs is not None else jobs
+    anchor = args.anchor if args.anchor.tzinfo else args.anchor.replace(tzinfo=timezone.utc)
+    dataset = SyntheticDataset(seed=args.seed, skills=args.skills, seniority=args.seniority,
+                               domains=args.domains, text_scale=args.text_scale, anchor=anchor)
+
+    with app.app_context():
+        db.create_all()
+        print("Clearing existing data...")
+        clear_tables()
+        print(f"Seeding {users:,} users, {jobs:,} jobs and {cvs:,} CVs (seed {args.seed}, "
+              f"{len(dataset.skills.items):,} skills)...")
+        started = time.perf_counter()
+        counters = load_dataset(dataset, users, cvs, jobs, args.chunk_size, args.pdfs, args.pdf_dir)
+        print(f"✅ Done in {time.perf_counter() - started:.1f}s; rebuilt {counters} statistics counters")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Structured (schema-validated) output for the LLM call sites.
+
+Holds the JSON schemas for the match result and the CV extraction, a fast
+validator that reports which top-level fields are missing or malformed, the
+request options for the provider's JSON modes, and in-process counters for
+parse failures and retry cost.
+"""
+
+import json
+import threading
+
+_CRITERION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "criterion": {"type": "string"},
+        "score": {"type": "number"},
+        "weight": {"type": "number"},
+        "weighted_score": {"type": "number"},
+        "explain": {"type": "string"},
+    },
+    "required": ["criterion", "score", "weight", "weighted_score", "explain"],
+    "additionalProperties": False,
+}
+
+MATCH_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "match_score": {"type": "integer"},
+        "analysis": {"type": "string"},
+        "strengths": {"type": "array", "items": {"type": "string"}},
+        "weaknesses": {"type": "array", "items": {"type": "string"}},
+        "recommendations": {"type": "array", "items": {"type": "string"}},
+        "criteria_breakdown": {"type": "array", "items": _CRITERION_SCHEMA},
+    },
+    "required": ["match_score", "analysis", "strengths", "weaknesses", "recommendations", "criteria_breakdown"],
+    "additionalProperties": False,
+}
+
+_CV_STRING_FIELDS = (
+    "name", "email", "phone", "address", "education", "experience", "skills",
+    "seniority", "core_skills", "languages", "work_model", "visa_status",
+    "secondary_skills", "domain", "kpi", "stack_versions", "soft_skills", "culture_process",
+)
+_CV_INT_FIELDS = ("years_experience", "recency_years")
+
+CV_EXTRACTION_SCHEMA = {
+    "type": "object",
+    "properties": dict(
+        [(key, {"type": "string"}) for key in _CV_STRING_FIELDS]
+        + [(key, {"type": ["integer", "null"]}) for key in _CV_INT_FIELDS]
+    ),
+    "required": list(_CV_STRING_FIELDS + _CV_INT_FIELDS),
+    "additionalProperties": False,
+}
+
+_TYPE_CHECKS = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+
+def _matches_type(value, spec):
+    types = spec.get("type")
+    if isinstance(types, str):
+        types = [types]
+    return any(_TYPE_CHECKS[t](value) for t in types)
+
+
+def _valid(value, spec):
+    if not _matches_type(value, spec):
+        return False
+    if spec.get("type") == "array" and "items" in spec:
+        return all(_valid(item, spec["items"]) for item in value)
+    if spec.get("type") == "object" and "properties" in spec:
+        for key in spec.get("required", []):
+            if key not in value or not _valid(value[key], spec["properties"][key]):
+                return False
+    return True
+
+
+def invalid_fields(data, schema):
+    """Return the required top-level keys of schema that are missing or malformed in data."""
+    if not isinstance(data, dict):
+        return list(schema["required"])
+    properties = schema["properties"]
+    return [key for key in schema["required"] if key not in data or not _valid(data[key], properties[key])]
+
+
+def response_format_options(mode, name, schema):
+    """Extra ChatCompletion kwargs for the configured output mode ('off', 'json_object', 'json_schema')."""
+    if mode == 'json_schema':
+        return {"response_format": {
+            "type": "json_schema",
+            "json_schema": {"name": name, "schema": schema, "strict": True},
+        }}
+    if mode == 'json_object':
+        return {"response_format": {"type": "json_object"}}
+    return {}
+
+
+def subset_schema(schema, fields):
+    """Schema for an object holding only the given fields of schema."""
+    return {
+        "type": "object",
+        "properties": {key: schema["properties"][key] for key in fields},
+        "required": list(fields),
+        "additionalProperties": False,
+    }
+
+
+def repair_prompt(fields, schema):
+    """Prompt asking the model to return only the given fields of schema."""
+    return (
+        "Your previous JSON was missing or had invalid values for these keys: "
+        f"{', '.join(fields)}.\n"
+        "Return ONLY a JSON object containing exactly these keys, following this schema, "
+        "in the same language as before:\n"
+        f"{json.dumps(subset_schema(schema, fields)['properties'], ensure_ascii=False)}"
+    )
+
+
+class OutputMetrics:
+    """Thread-safe counters for structured output parsing and retry cost."""
+
+    FIELDS = (
+        'calls', 'parse_failures', 'schema_failures', 'repairs', 'repairs_succeeded',
+        'full_retries', 'retry_tokens', 'retry_seconds',
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def incr(self, kind, field, amount=1):
+        with self._lock:
+            counters = self._counters.setdefault(kind, dict.fromkeys(self.FIELDS, 0))
+            counters[field] += amount
+
+    def snapshot(self):
+        with self._lock:
+            result = {}
+            for kind, counters in self._counters.items():
+                data = dict(counters)
+                calls = data['calls'] or 1
+                data['parse_failure_rate'] = round(data['parse_failures'] / calls, 4)
+                data['schema_failure_rate'] = round(data['schema_failures'] / calls, 4)
+                data['retry_seconds'] = round(data['retry_seconds'], 3)
+                result[kind] = data
+            return result
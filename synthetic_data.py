@@ -0,0 +1,354 @@
+"""
+Deterministic synthetic users, CVs, jobs and CV PDFs for load tests and benchmarks.
+
+Every entity stream has its own random.Random seeded from (seed, entity), so the
+same seed and options always produce the same rows, and changing the number
+of jobs does not change the CVs. Timestamps are offsets from a fixed anchor.
+Skills follow a Zipf-like popularity curve over a vocabulary of configurable
+size, so a few skills are very common and most are rare, as in real data.
+"""
+
+import bisect
+import itertools
+import random
+import textwrap
+from datetime import datetime, timedelta, timezone
+
+DATASET_PRESETS = {
+    # name: (users, cvs, jobs)
+    'small': (20, 1_000, 200),
+    'medium': (200, 100_000, 10_000),
+    'large': (2_000, 1_000_000, 100_000),
+}
+
+DEFAULT_ANCHOR = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+SENIORITY = {'Entry': 0.25, 'Mid': 0.4, 'Senior': 0.25, 'Lead': 0.1}
+DOMAINS = {
+    'Fintech': 0.2, 'E-commerce': 0.2, 'Healthcare': 0.12, 'Logistics': 0.1, 'Education': 0.1,
+    'Gaming': 0.08, 'Telecom': 0.08, 'Government': 0.05, None: 0.07,
+}
+
+BASE_SKILLS = [
+    'Python', 'JavaScript', 'TypeScript', 'SQL', 'Java', 'React', 'Node.js', 'Docker', 'AWS', 'Git',
+    'Linux', 'Django', 'Flask', 'PostgreSQL', 'MySQL', 'Kubernetes', 'Go', 'C#', '.NET', 'Vue.js',
+    'Angular', 'Redis', 'GraphQL', 'REST APIs', 'Terraform', 'GCP', 'Azure', 'Spring Boot', 'Kafka',
+    'MongoDB', 'Pandas', 'PyTorch', 'TensorFlow', 'Spark', 'Airflow', 'Kotlin', 'Swift', 'Flutter',
+    'PHP', 'Laravel', 'Ruby on Rails', 'Elasticsearch', 'RabbitMQ', 'CI/CD', 'Jenkins', 'Figma',
+    'Selenium', 'Cypress', 'Rust', 'Scala', 'Tableau', 'Power BI', 'Snowflake', 'dbt', 'FastAPI',
+]
+_SYLLABLES = ['ka', 'ro', 'zen', 'vi', 'tor', 'lu', 'mex', 'qua', 'sil', 'dra', 'no', 'pix', 'ter', 'fy', 'ban', 'lo']
+_SKILL_SUFFIXES = ['', 'JS', 'DB', ' Cloud', ' ML', 'QL', ' Studio', 'Ops']
+
+ROLES = [
+    'Backend Engineer', 'Frontend Engineer', 'Fullstack Developer', 'Data Scientist', 'Data Engineer',
+    'DevOps Engineer', 'Mobile Developer', 'QA Engineer', 'Product Manager', 'UI/UX Designer',
+    'Solutions Architect', 'Machine Learning Engineer', 'Site Reliability Engineer', 'Business Analyst',
+]
+COMPANIES = [
+    'TechCorp', 'InnoSoft', 'DataWorks', 'CloudNine', 'PixelLabs', 'GreenAI', 'NextGen', 'BrightApps',
+    'AlphaStack', 'NovaDigital', 'BlueOcean Systems', 'Sunrise Payments', 'MekongSoft', 'LotusTech',
+]
+LOCATIONS = ['Ho Chi Minh City', 'Hanoi', 'Da Nang', 'Can Tho', 'Hai Phong', 'Singapore', 'Remote']
+FIRST_NAMES = ['An', 'Binh', 'Chi', 'Dung', 'Giang', 'Hai', 'Hoa', 'Khanh', 'Lan', 'Linh', 'Minh', 'Nam',
+               'Ngoc', 'Phuong', 'Quang', 'Son', 'Thao', 'Trang', 'Tuan', 'Vy']
+MIDDLE_NAMES = ['Van', 'Thi', 'Duc', 'Minh', 'Thanh', 'Ngoc', 'Quoc', 'Hoang']
+LAST_NAMES = ['Nguyen', 'Tran', 'Le', 'Pham', 'Hoang', 'Phan', 'Vu', 'Vo', 'Dang', 'Bui', 'Do', 'Ho', 'Ngo', 'Duong']
+LANGUAGES = ['English B2', 'English C1', 'English B1', 'Japanese N3', 'Japanese N2', 'Korean TOPIK 4', 'French B1']
+WORK_MODES = ['Remote', 'On-site', 'Hybrid']
+EMPLOYMENT_TYPES = ['Full-time', 'Full-time', 'Full-time', 'Part-time', 'Contract']
+EDUCATION = ['Bachelor of Computer Science', 'Bachelor of IT', 'Master of Computer Science',
+             'Bachelor of Software Engineering', 'Master of Data Science', 'College Diploma in IT', 'High School']
+SOFT_SKILLS = ['Communication', 'Teamwork', 'Leadership', 'Mentoring', 'Problem solving', 'Ownership',
+               'Time management', 'Stakeholder management', 'Adaptability']
+PROCESSES = ['Agile', 'Scrum', 'Kanban', 'Waterfall', None]
+BENEFITS = ['Health insurance', 'Annual bonus', '13th month salary', 'Remote-friendly', 'Training budget',
+            'Flexible hours', 'Stock options', 'Laptop allowance', 'Team building trips']
+
+_VERBS = ['Designed', 'Built', 'Maintained', 'Migrated', 'Optimized', 'Led the rewrite of', 'Automated',
+          'Scaled', 'Refactored', 'Delivered', 'Shipped', 'Monitored']
+_OBJECTS = ['a payment gateway', 'the order service', 'an internal reporting tool', 'a recommendation engine',
+            'the customer portal', 'a data pipeline', 'the mobile checkout flow', 'an event ingestion API',
+            'a search backend', 'the billing platform', 'a fraud detection model', 'the CI pipeline']
+_RESULTS = ['cutting latency by {n}%', 'serving {n}k daily users', 'reducing cloud costs by {n}%',
+            'raising test coverage to {n}%', 'handling {n}k requests per minute', 'shortening releases by {n}%']
+_DUTIES = ['Own the design and delivery of {obj} built on {skill}.', 'Work with product and design on {obj}.',
+           'Review code and mentor engineers working with {skill}.', 'Improve reliability and performance of {obj}.',
+           'Write tests and documentation for services using {skill} and {skill2}.']
+
+_SALARY_BASE = {'Entry': 600, 'Mid': 1200, 'Senior': 2200, 'Lead': 3200}
+_YEARS = {'Entry': (0, 2), 'Mid': (2, 5), 'Senior': (5, 10), 'Lead': (8, 15)}
+_TEXT_LENGTH = {'Entry': 2, 'Mid': 3, 'Senior': 4, 'Lead': 5}
+
+
+def chunked(rows, size):
+    """Lists of up to size rows, for executemany INSERTs."""
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, size)):
+        yield batch
+
+
+def parse_distribution(text):
+    """'Mid=0.5,Senior=0.3,Lead=0.2' -> {'Mid': 0.5, ...}; 'none' as a key means an empty value."""
+    weights = {}
+    for part in filter(None, (p.strip() for p in text.split(','))):
+        name, _, weight = part.partition('=')
+        try:
+            value = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight in {part!r}") from None
+        if value < 0:
+            raise ValueError(f"Negative weight in {part!r}")
+        weights[None if name.strip().lower() == 'none' else name.strip()] = value
+    if not weights or not sum(weights.values()):
+        raise ValueError(f"Empty distribution: {text!r}")
+    return weights
+
+
+def skill_vocabulary(size, seed=0):
+    """BASE_SKILLS followed by generated, unique tool-like names up to size entries."""
+    if size <= len(BASE_SKILLS):
+        return BASE_SKILLS[:size]
+    rng = random.Random(f"{seed}:skills")
+    skills, seen = list(BASE_SKILLS), set(BASE_SKILLS)
+    while len(skills) < size:
+        for _ in range(20):
+            name = ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+            name += rng.choice(_SKILL_SUFFIXES)
+            if name not in seen:
+                break
+        else:
+            name = f"{name} {len(skills)}"  # the syllable space is finite
+        seen.add(name)
+        skills.append(name)
+    return skills
+
+
+class WeightedChoice:
+    """Repeated weighted sampling with precomputed cumulative weights."""
+
+    def __init__(self, items, weights):
+        self.items = list(items)
+        self.cum_weights = list(itertools.accumulate(weights))
+        self.total = self.cum_weights[-1]
+
+    @classmethod
+    def from_mapping(cls, weights):
+        return cls(weights.keys(), weights.values())
+
+    @classmethod
+    def zipf(cls, items, exponent=1.1):
+        return cls(items, [1 / rank ** exponent for rank in range(1, len(items) + 1)])
+
+    def pick(self, rng):
+        return self.items[bisect.bisect(self.cum_weights, rng.random() * self.total)]
+
+    def sample(self, rng, k):
+        """Up to k distinct items (fewer when the vocabulary is smaller)."""
+        k = min(k, len(self.items))
+        picked = {}
+        for _ in range(k * 4):
+            item = self.pick(rng)
+            picked[item] = None
+            if len(picked) == k:
+                break
+        return list(picked)
+
+
+class SyntheticDataset:
+    """Row generators for User, CV and Job tables; rows are plain dicts for Core INSERTs.
+
+    text_scale multiplies the number of paragraphs in long text fields
+    (experience, description, requirements).
+    """
+
+    def __init__(self, seed=42, skills=500, seniority=None, domains=None, text_scale=1.0, anchor=None):
+        self.seed = seed
+        self.text_scale = text_scale
+        self.anchor = anchor or DEFAULT_ANCHOR
+        self.skills = WeightedChoice.zipf(skill_vocabulary(skills, seed))
+        self.seniority = WeightedChoice.from_mapping(seniority or SENIORITY)
+        self.domains = WeightedChoice.from_mapping(domains or DOMAINS)
+
+    def _rng(self, entity):
+        return random.Random(f"{self.seed}:{entity}")
+
+    def _paragraphs(self, rng, level, make):
+        count = max(1, round(_TEXT_LENGTH.get(level, 3) * self.text_scale * rng.uniform(0.6, 1.4)))
+        return '\n\n'.join(make() for _ in range(count))
+
+    def _achievement(self, rng, domain):
+        skill, skill2 = (self.skills.sample(rng, 2) * 2)[:2]
+        result = rng.choice(_RESULTS).format(n=rng.randint(10, 90))
+        where = f" for a {domain} product" if domain else ''
+        return f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)}{where} with {skill} and {skill2}, {result}."
+
+    def users(self, count, password_hash):
+        for index in range(1, count + 1):
+            yield {
+                'username': f"user_{index:05d}",
+                'email': f"user_{index:05d}@example.com",
+                'password_hash': password_hash,
+                'is_admin': index == 1,
+                'created_at': self.anchor - timedelta(days=400 - index % 30),
+            }
+
+    def cvs(self, count, user_ids=(None,)):
+        rng = self._rng('cvs')
+        for index in range(1, count + 1):
+            level = self.seniority.pick(rng)
+            domain = self.domains.pick(rng)
+            low, high = _YEARS.get(level, (0, 10))
+            years = rng.randint(low, high)
+            core = self.skills.sample(rng, rng.randint(4, 9))
+            secondary = [s for s in self.skills.sample(rng, rng.randint(2, 6)) if s not in core]
+            name = f"{rng.choice(LAST_NAMES)} {rng.choice(MIDDLE_NAMES)} {rng.choice(FIRST_NAMES)}"
+            created = self.anchor - timedelta(seconds=rng.randint(0, 365 * 86400))
+
+            def job_history():
+                sentences = ' '.join(self._achievement(rng, domain) for _ in range(rng.randint(3, 6)))
+                return f"{rng.choice(ROLES)} at {rng.choice(COMPANIES)} ({rng.randint(1, 4)} years). {sentences}"
+
+            yield {
+                'name': name,
+                'email': f"candidate{index}@example.com",
+                'phone': f"09{rng.randint(10000000, 99999999)}",
+                'address': rng.choice(LOCATIONS),
+                'education': rng.choice(EDUCATION),
+                'experience': self._paragraphs(rng, level, job_history),
+                'skills': ', '.join(core + secondary),
+                'detected_language': 'en',
+                'user_id': rng.choice(user_ids),
+                'created_at': created,
+                'updated_at': created,
+                'cv_seniority': level,
+                'cv_core_skills': ', '.join(core),
+                'cv_languages': ', '.join(rng.sample(LANGUAGES, rng.randint(1, 2))),
+                'cv_work_model': rng.choice(WORK_MODES),
+                'cv_visa_status': rng.choice(['Eligible', 'Eligible', 'Not Eligible', None]),
+                'cv_secondary_skills': ', '.join(secondary),
+                'cv_years_experience': years,
+                'cv_recency_years': rng.randint(0, 3),
+                'cv_domain': domain,
+                'cv_kpi': self._achievement(rng, domain),
+                'cv_stack_versions': ', '.join(f"{s} {rng.randint(1, 20)}" for s in core[:3]),
+                'cv_soft_skills': ', '.join(rng.sample(SOFT_SKILLS, 3)),
+                'cv_culture_process': rng.choice(PROCESSES),
+            }
+
+    def jobs(self, count, user_ids=(None,), active_ratio=0.8):
+        rng = self._rng('jobs')
+        for index in range(1, count + 1):
+            level = self.seniority.pick(rng)
+            domain = self.domains.pick(rng)
+            role = rng.choice(ROLES)
+            company = rng.choice(COMPANIES)
+            core = self.skills.sample(rng, rng.randint(3, 7))
+            secondary = [s for s in self.skills.sample(rng, rng.randint(2, 5)) if s not in core]
+            low, high = _YEARS.get(level, (0, 10))
+            salary_min = _SALARY_BASE.get(level, 1000) + rng.randint(0, 8) * 100
+            created = self.anchor - timedelta(seconds=rng.randint(0, 365 * 86400))
+            work_mode = rng.choice(WORK_MODES)
+
+            def duty():
+                skill, skill2 = (self.skills.sample(rng, 2) * 2)[:2]
+                return rng.choice(_DUTIES).format(obj=rng.choice(_OBJECTS), skill=skill, skill2=skill2)
+
+            yield {
+                'title': f"{level} {role}" if level else role,
+                'description': (f"{company} is hiring a {role}" + (f" for its {domain} business" if domain else '')
+                                + '.\n\n' + self._paragraphs(rng, level, lambda: ' '.join(duty() for _ in range(4)))),
+                'company': company,
+                'location': rng.choice(LOCATIONS),
+                'salary_min': salary_min,
+                'salary_max': salary_min + rng.randint(2, 12) * 100,
+                'employment_type': rng.choice(EMPLOYMENT_TYPES),
+                'requirements': self._paragraphs(rng, level, lambda: ' '.join(
+                    f"Experience with {s}." for s in self.skills.sample(rng, 4))),
+                'benefits': '; '.join(rng.sample(BENEFITS, 4)),
+                'application_deadline': self.anchor + timedelta(days=rng.randint(-30, 90)),
+                'hiring_quantity': rng.randint(1, 5),
+                'experience_level': level,
+                'work_mode': work_mode,
+                'industry': domain or 'Technology',
+                'skills_required': ', '.join(core),
+                'education_required': rng.choice(EDUCATION),
+                'is_active': rng.random() < active_ratio,
+                'user_id': rng.choice(user_ids),
+                'created_at': created,
+                'updated_at': created,
+                'criteria_seniority': level,
+                'criteria_core_skills': ', '.join(core),
+                'criteria_language': rng.choice(LANGUAGES + [None]),
+                'criteria_work_model': work_mode,
+                'criteria_visa_required': rng.random() < 0.2,
+                'criteria_secondary_skills': ', '.join(secondary),
+                'criteria_years_experience': low if high > low else None,
+                'criteria_recency_years': rng.choice([None, 1, 2, 3]),
+                'criteria_domain': domain,
+                'criteria_kpi_required': rng.random() < 0.3,
+                'criteria_stack_versions': ', '.join(f"{s} {rng.randint(1, 20)}+" for s in core[:2]),
+                'criteria_soft_skills': ', '.join(rng.sample(SOFT_SKILLS, 2)),
+                'criteria_culture_process': rng.choice(PROCESSES),
+            }
+
+
+def cv_document_lines(row):
+    """The text of a CV row laid out as a resume, one string per line."""
+    lines = [row['name'], f"{row['email']} | {row['phone']} | {row['address']}", '']
+    sections = [
+        ('SUMMARY', f"{row['cv_seniority']} engineer with {row['cv_years_experience']} years of experience"
+                    + (f" in {row['cv_domain']}" if row['cv_domain'] else '') + f". {row['cv_kpi']}"),
+        ('SKILLS', row['skills']),
+        ('EXPERIENCE', row['experience']),
+        ('EDUCATION', row['education']),
+        ('LANGUAGES', row['cv_languages']),
+    ]
+    for heading, body in sections:
+        lines.append(heading)
+        for paragraph in (body or '').split('\n\n'):
+            lines.extend(textwrap.wrap(paragraph, 95) or [''])
+            lines.append('')
+    return lines
+
+
+def _pdf_escape(text):
+    text = text.encode('latin-1', 'replace').decode('latin-1')
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(path, lines, lines_per_page=54):
+    """Write a minimal text PDF (Helvetica, A4) whose text PyPDF2 can extract.
+
+    No timestamps or random IDs are embedded, so the bytes depend only on lines.
+    """
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    font_id = 3
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        font_id: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    }
+    page_ids = []
+    for number, page in enumerate(pages):
+        page_id, content_id = 4 + number * 2, 5 + number * 2
+        page_ids.append(page_id)
+        text = ''.join(f"({_pdf_escape(line)}) Tj T*\n" for line in page)
+        stream = f"BT /F1 10 Tf 13 TL 50 800 Td\n{text}ET".encode('latin-1')
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        objects[page_id] = (b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (font_id, content_id))
+    kids = ' '.join(f"{i} 0 R" for i in page_ids).encode()
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (obj_id, objects[obj_id])
+    xref = len(out)
+    size = max(objects) + 1
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    out += b''.join(b"%010d 00000 n \n" % offsets[i] for i in range(1, size))
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref)
+    with open(path, 'wb') as handle:
+        handle.write(out)
@@ -14,6 +14,9 @@ def main():
         sys.exit(1)
 
     openai.api_key = key
+    if os.environ.get("OPENAI_API_BASE"):
+        openai.api_base = os.environ["OPENAI_API_BASE"].rstrip("/")
+        print("BASE:", openai.api_base)
     # Print masked key for verification
     try:
         masked = key[:6] + "..." + key[-4:] if len(key) > 12 else "(short)"
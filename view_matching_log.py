@@ -1,57 +1,359 @@
 #!/usr/bin/env python3
 """
-Script to view matching debug log
+View and filter the JSON-lines matching log (matching_debug.log).
+
+Lines are read one at a time, so memory use does not grow with the log.
+A sidecar index (<log>.idx) records, for each ~1 MB block, its byte range,
+time range and the run/CV/job ids it contains. Filtered queries seek
+straight to matching blocks; the index is extended incrementally and
+rebuilt when the log has been rotated or cleared.
+
+Run:  python view_matching_log.py                                  # whole log
+      python view_matching_log.py --cv 42 --job 7 --since 2h
+      python view_matching_log.py --run 3f9c0a1b2d4e --json
+      python view_matching_log.py --since 2026-10-18T09:00 --until 2026-10-18T10:00 --event match
+      python view_matching_log.py --follow --job 7                 # like tail -f
+      python view_matching_log.py clear
 """
 
+import argparse
+import hashlib
+import json
 import os
+import re
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
+
+LOG_FILE = 'matching_debug.log'
+INDEX_VERSION = 1
+BLOCK_BYTES = 1024 * 1024
+# A block lists its ids only while it has at most this many distinct values; beyond that it is always scanned
+MAX_BLOCK_IDS = 256
+HEAD_BYTES = 256
+
+_RELATIVE = re.compile(r'^(\d+(?:\.\d+)?)([smhd])$')
+_UNITS = {'s': 'seconds', 'm': 'minutes', 'h': 'hours', 'd': 'days'}
+
+
+def parse_time(value):
+    """ISO timestamp (naive means UTC) or a relative age like 15m / 2h / 7d, as the log's ts format."""
+    match = _RELATIVE.match(value.strip())
+    if match:
+        moment = datetime.now(timezone.utc) - timedelta(**{_UNITS[match.group(2)]: float(match.group(1))})
+    else:
+        moment = datetime.fromisoformat(value.strip())
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat(timespec='milliseconds')
+
+
+def parse_line(line):
+    """Entry dict for a log line; older plain-text lines become {'msg': line}."""
+    line = line.rstrip('\n')
+    if line.startswith('{'):
+        try:
+            return json.loads(line)
+        except ValueError:
+            pass
+    return {'msg': line}
+
+
+class Filters:
+    def __init__(self, run=None, cv=None, job=None, since=None, until=None, event=None, level=None, text=None):
+        self.run = run
+        self.cv = cv
+        self.job = job
+        self.since = since
+        self.until = until
+        self.event = event
+        self.level = level.upper() if level else None
+        self.text = text
+        # Cheap substring checks that reject most lines before json.loads
+        self.needles = [needle for needle in (
+            f'"run": "{run}"' if run else None,
+            f'"cv_id": {cv}' if cv is not None else None,
+            f'"job_id": {job}' if job is not None else None,
+            f'"event": "{event}"' if event else None,
+        ) if needle]
+
+    @property
+    def active(self):
+        return any(value is not None for value in (
+            self.run, self.cv, self.job, self.since, self.until, self.event, self.level, self.text))
+
+    def block_may_match(self, block):
+        if self.since and block['ts_max'] and block['ts_max'] < self.since:
+            return False
+        if self.until and block['ts_min'] and block['ts_min'] > self.until:
+            return False
+        for key, wanted in (('runs', self.run), ('cvs', self.cv), ('jobs', self.job)):
+            if wanted is not None and block[key] is not None and wanted not in block[key]:
+                return False
+        return True
+
+    def match_line(self, line):
+        if any(needle not in line for needle in self.needles):
+            return None
+        if self.text and self.text not in line:
+            return None
+        entry = parse_line(line)
+        if not self.active:
+            return entry
+        ts = entry.get('ts')
+        if (self.since or self.until) and not ts:
+            return None
+        if self.since and ts < self.since:
+            return None
+        if self.until and ts > self.until:
+            return None
+        if self.run and entry.get('run') != self.run:
+            return None
+        if self.cv is not None and entry.get('cv_id') != self.cv:
+            return None
+        if self.job is not None and entry.get('job_id') != self.job:
+            return None
+        if self.event and entry.get('event') != self.event:
+            return None
+        if self.level and entry.get('level') != self.level:
+            return None
+        return entry
+
+
+def _head_digest(path):
+    with open(path, 'rb') as handle:
+        return hashlib.sha1(handle.read(HEAD_BYTES)).hexdigest()
+
+
+def _new_block(offset):
+    return {'offset': offset, 'end': offset, 'ts_min': None, 'ts_max': None, 'runs': set(), 'cvs': set(), 'jobs': set()}
+
+
+def _add_id(block, key, value):
+    if value is not None and block[key] is not None:
+        block[key].add(value)
+        if len(block[key]) > MAX_BLOCK_IDS:
+            block[key] = None
+
+
+def _close_block(block):
+    closed = dict(block)
+    for key in ('runs', 'cvs', 'jobs'):
+        if closed[key] is not None:
+            closed[key] = sorted(closed[key])
+    return closed
+
 
-def view_log():
+def update_index(path, index_path=None):
+    """Extend (or rebuild) the block index of path; returns the list of indexed blocks."""
+    index_path = index_path or f"{path}.idx"
+    head = _head_digest(path)
+    size = os.path.getsize(path)
+    blocks = []
+    if os.path.exists(index_path):
+        with open(index_path, encoding='utf-8') as handle:
+            header = json.loads(handle.readline() or '{}')
+            if header.get('version') == INDEX_VERSION and header.get('head') == head:
+                blocks = [json.loads(line) for line in handle]
+    indexed = blocks[-1]['end'] if blocks else 0
+    if indexed > size:
+        blocks, indexed = [], 0  # truncated and rewritten since the index was built
+
+    new_blocks = []
+    if size - indexed >= BLOCK_BYTES:
+        with open(path, 'rb') as handle:
+            handle.seek(indexed)
+            block = _new_block(indexed)
+            while True:
+                raw = handle.readline()
+                if not raw.endswith(b'\n'):
+                    break  # a line still being written stays unindexed
+                entry = parse_line(raw.decode('utf-8', errors='replace'))
+                block['end'] += len(raw)
+                ts = entry.get('ts')
+                if ts:
+                    block['ts_min'] = min(block['ts_min'] or ts, ts)
+                    block['ts_max'] = max(block['ts_max'] or ts, ts)
+                _add_id(block, 'runs', entry.get('run'))
+                _add_id(block, 'cvs', entry.get('cv_id'))
+                _add_id(block, 'jobs', entry.get('job_id'))
+                if block['end'] - block['offset'] >= BLOCK_BYTES:
+                    new_blocks.append(_close_block(block))
+                    block = _new_block(block['end'])
+                    # Only whole blocks are indexed; the remainder is scanned at query time
+                    if size - block['offset'] < BLOCK_BYTES:
+                        break
+
+    if new_blocks or not blocks:
+        mode = 'a' if blocks else 'w'
+        with open(index_path, mode, encoding='utf-8') as handle:
+            if mode == 'w':
+                handle.write(json.dumps({'version': INDEX_VERSION, 'head': head, 'block_bytes': BLOCK_BYTES}) + '\n')
+            for block in new_blocks:
+                handle.write(json.dumps(block) + '\n')
+    return blocks + new_blocks
+
+
+def _read_range(handle, start, end):
+    handle.seek(start)
+    position = start
+    while end is None or position < end:
+        raw = handle.readline()
+        if not raw:
+            break
+        position += len(raw)
+        yield raw.decode('utf-8', errors='replace')
+
+
+def iter_entries(path, filters, use_index=True):
+    """Matching entries of path in file order, reading only the blocks that can match."""
+    blocks = update_index(path) if use_index and filters.active else []
+    tail_start = blocks[-1]['end'] if blocks else 0
+    with open(path, 'rb') as handle:
+        for block in blocks:
+            if filters.block_may_match(block):
+                for line in _read_range(handle, block['offset'], block['end']):
+                    entry = filters.match_line(line)
+                    if entry is not None:
+                        yield entry
+        for line in _read_range(handle, tail_start, None):
+            entry = filters.match_line(line)
+            if entry is not None:
+                yield entry
+
+
+def follow(path, filters, poll_seconds=0.5):
+    """Yield new matching entries as they are written; follows the log across rotation."""
+    handle = open(path, 'rb')
+    handle.seek(0, os.SEEK_END)
+    inode = os.fstat(handle.fileno()).st_ino
+    pending = b''
+    try:
+        while True:
+            raw = handle.readline()
+            if raw:
+                pending += raw
+                if pending.endswith(b'\n'):
+                    entry = filters.match_line(pending.decode('utf-8', errors='replace'))
+                    pending = b''
+                    if entry is not None:
+                        yield entry
+                continue
+            time.sleep(poll_seconds)
+            try:
+                current = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if current.st_ino != inode or current.st_size < handle.tell():
+                # Rotated or truncated: finish the old file (readline above drained it), then start the new one
+                if handle.read(1):
+                    handle.seek(-1, os.SEEK_CUR)
+                    continue
+                handle.close()
+                handle = open(path, 'rb')
+                inode = os.fstat(handle.fileno()).st_ino
+                pending = b''
+    finally:
+        handle.close()
+
+
+def format_entry(entry):
+    if 'ts' not in entry:
+        return entry.get('msg', '')
+    ids = ' '.join(f"{label}={entry[key]}" for label, key in (('cv', 'cv_id'), ('job', 'job_id')) if entry.get(key) is not None)
+    parts = [entry['ts'], f"{entry.get('level', ''):7}", entry.get('run') or '-']
+    if ids:
+        parts.append(ids)
+    if entry.get('event') == 'match':
+        parts.append(f"[{entry.get('cache')} {entry.get('ms')}ms]")
+    parts.append(entry.get('msg', ''))
+    if entry.get('exc'):
+        parts.append('\n' + entry['exc'])
+    return ' '.join(str(part) for part in parts)
+
+
+def view_log(args):
     """View the matching debug log"""
-    log_file = 'matching_debug.log'
-    
+    log_file = args.file
+
     if not os.path.exists(log_file):
-        print("❌ Log file not found: matching_debug.log")
-        return
-    
-    print("📋 JobFit Analytics - Matching Debug Log")
-    print("=" * 50)
-    print(f"📅 Last updated: {datetime.fromtimestamp(os.path.getmtime(log_file))}")
-    print(f"📏 File size: {os.path.getsize(log_file)} bytes")
-    print("=" * 50)
-    print()
-    
+        print(f"❌ Log file not found: {log_file}")
+        return 1
+
+    filters = Filters(run=args.run, cv=args.cv, job=args.job, since=args.since, until=args.until,
+                      event=args.event, level=args.level, text=args.grep)
+    emit = (lambda entry: json.dumps(entry, ensure_ascii=False)) if args.json else format_entry
+
+    if args.follow:
+        try:
+            for entry in follow(log_file, filters):
+                print(emit(entry), flush=True)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if not args.json:
+        print("📋 JobFit Analytics - Matching Debug Log")
+        print("=" * 50)
+        print(f"📅 Last updated: {datetime.fromtimestamp(os.path.getmtime(log_file))}")
+        print(f"📏 File size: {os.path.getsize(log_file):,} bytes")
+        print("=" * 50)
+        print()
+
+    shown = 0
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if content.strip():
-                print(content)
-            else:
-                print("📝 Log file is empty")
+        for entry in iter_entries(log_file, filters, use_index=not args.no_index):
+            print(emit(entry))
+            shown += 1
+            if args.limit and shown >= args.limit:
+                break
+    except BrokenPipeError:
+        return 0
     except Exception as e:
         print(f"❌ Error reading log file: {e}")
+        return 1
+    if not shown and not args.json:
+        print("📝 No matching log entries")
+    return 0
 
-def clear_log():
+
+def clear_log(log_file):
     """Clear the matching debug log"""
-    log_file = 'matching_debug.log'
-    
     try:
-        with open(log_file, 'w', encoding='utf-8') as f:
-            f.write(f"# JobFit Analytics - Matching Debug Log\n")
-            f.write(f"# Log cleared at: {datetime.now()}\n")
-            f.write(f"# This file contains detailed logs for matching functionality debugging\n\n")
-            f.write("=== LOG CLEARED ===\n")
+        with open(log_file, 'w', encoding='utf-8'):
+            pass
+        if os.path.exists(f"{log_file}.idx"):
+            os.remove(f"{log_file}.idx")
         print("✅ Log file cleared successfully")
     except Exception as e:
         print(f"❌ Error clearing log file: {e}")
+        return 1
+    return 0
+
 
-def main():
+def main(argv=None):
     """Main function"""
-    if len(sys.argv) > 1 and sys.argv[1] == 'clear':
-        clear_log()
-    else:
-        view_log()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('command', nargs='?', choices=('view', 'clear'), default='view')
+    parser.add_argument('--file', default=LOG_FILE)
+    parser.add_argument('--run', help='Match run id (one per request).')
+    parser.add_argument('--cv', type=int, help='CV id.')
+    parser.add_argument('--job', type=int, help='Job id.')
+    parser.add_argument('--since', type=parse_time, help='ISO time (UTC if no offset) or age such as 30m, 2h, 7d.')
+    parser.add_argument('--until', type=parse_time, help='Same formats as --since.')
+    parser.add_argument('--event', help='e.g. match (one per scored CV/job pair) or run (request summary).')
+    parser.add_argument('--level', help='e.g. ERROR.')
+    parser.add_argument('--grep', help='Plain substring the raw line must contain.')
+    parser.add_argument('--limit', type=int, help='Stop after this many entries.')
+    parser.add_argument('--json', action='store_true', help='Print matching entries as JSON lines.')
+    parser.add_argument('--follow', '-f', action='store_true', help='Keep printing new matching lines.')
+    parser.add_argument('--no-index', action='store_true', help='Scan the whole file instead of using the sidecar index.')
+    args = parser.parse_args(argv)
+
+    if args.command == 'clear':
+        return clear_log(args.file)
+    return view_log(args)
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())